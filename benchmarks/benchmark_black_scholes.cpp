@@ -22,6 +22,8 @@
  * SOFTWARE.
  */
 
+#include <vector>
+
 #include "benchmark/benchmark.h"
 #include "trading/black_scholes.h"
 
@@ -38,3 +40,33 @@ static void BM_BlackScholes_Put(benchmark::State& state) {
     }
 }
 BENCHMARK(BM_BlackScholes_Put);
+
+// Chain pricing: one scalar call per contract versus one pass over the
+// struct-of-arrays chain.
+static void BM_BlackScholes_ChainScalarLoop(benchmark::State& state) {
+    std::size_t n = static_cast<std::size_t>(state.range(0));
+    std::vector<double> S(n, 100.0), K(n), T(n, 1.0), sigma(n, 0.2);
+    for (std::size_t i = 0; i < n; ++i) {
+        K[i] = 50.0 + static_cast<double>(i % 100);
+    }
+    for (auto _ : state) {
+        for (std::size_t i = 0; i < n; ++i) {
+            benchmark::DoNotOptimize(BlackScholes::calculate_option_price(
+                S[i], K[i], T[i], 0.05, sigma[i], OptionType::CALL));
+        }
+    }
+}
+BENCHMARK(BM_BlackScholes_ChainScalarLoop)->Arg(1024);
+
+static void BM_BlackScholes_ChainBatch(benchmark::State& state) {
+    std::size_t n = static_cast<std::size_t>(state.range(0));
+    std::vector<double> S(n, 100.0), K(n), T(n, 1.0), sigma(n, 0.2);
+    for (std::size_t i = 0; i < n; ++i) {
+        K[i] = 50.0 + static_cast<double>(i % 100);
+    }
+    for (auto _ : state) {
+        benchmark::DoNotOptimize(BlackScholes::calculate_option_prices(
+            S, K, T, 0.05, sigma, OptionType::CALL));
+    }
+}
+BENCHMARK(BM_BlackScholes_ChainBatch)->Arg(1024);
@@ -0,0 +1,274 @@
+/*
+ * MIT License
+ *
+ * Copyright (c) 2024 Cody Michael Jones
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining a copy
+ * of this software and associated documentation files (the "Software"), to deal
+ * in the Software without restriction, including without limitation the rights
+ * to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+ * copies of the Software, and to permit persons to whom the Software is
+ * furnished to do so, subject to the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be included in
+ * all copies or substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ * IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ * FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+ * AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ * LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+ * OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+ * SOFTWARE.
+ */
+
+#pragma once
+
+#include <cstddef>
+#include <cstdint>
+#include <string>
+#include <unordered_map>
+#include <utility>
+#include <vector>
+
+#include "backtest/market_data.h"
+#include "data/data_loader.h"
+#include "trading/order.h"
+#include "trading/position.h"
+#include "trading/strategy.h"
+
+namespace thales {
+
+/**
+ * @struct TradeLog
+ * @brief Columnar record of the orders executed during a run.
+ *
+ * Trades are stored as parallel arrays rather than one Order object per
+ * trade, so recording a trade appends a handful of scalars instead of
+ * constructing five heap-allocated strings. Symbols and expiration dates
+ * are interned; day_indices refer to the engine's per-day date stamps.
+ */
+struct TradeLog {
+    std::vector<std::uint8_t> is_buy;       /**< 1 for Buy, 0 for Sell. */
+    std::vector<std::uint32_t> symbol_ids;  /**< Interned symbol ids. */
+    std::vector<std::uint8_t> is_call;      /**< 1 for Call, 0 for Put. */
+    std::vector<double> strike_prices;      /**< Strike prices. */
+    std::vector<std::uint32_t> expiry_ids;  /**< Interned expiration ids. */
+    std::vector<std::int32_t> quantities;   /**< Contract counts. */
+    std::vector<double> premiums;           /**< Premiums per contract. */
+    std::vector<std::uint32_t> day_indices; /**< Trading day of each trade. */
+    std::vector<std::string> expiry_table;  /**< Expiration date per id. */
+
+    /**
+     * @brief Gets the number of recorded trades.
+     * @return The trade count.
+     */
+    std::size_t size() const { return is_buy.size(); }
+};
+
+/**
+ * @struct BacktestMetrics
+ * @brief Summary statistics for a completed backtest run.
+ */
+struct BacktestMetrics {
+    double total_return;  /**< Final value relative to initial capital. */
+    double sharpe_ratio;  /**< Annualized Sharpe ratio of daily returns. */
+    double max_drawdown;  /**< Largest peak-to-trough decline (negative). */
+};
+
+/**
+ * @class BacktestEngine
+ * @brief Replays historical market data through a strategy day by day.
+ *
+ * The engine consumes a MarketDataSet prepared once by the DataLoader:
+ * sorted flat columns with per-day slices already indexed. Each trading
+ * day is handed to the strategy in one batched call instead of one call
+ * per record, and the same prepared set can be replayed by any number of
+ * engines or strategies without re-preparing.
+ */
+class BacktestEngine {
+   public:
+    /**
+     * @brief Constructs a BacktestEngine object.
+     * @param initial_capital The starting cash balance.
+     */
+    explicit BacktestEngine(double initial_capital);
+
+    /**
+     * @brief Sets a prepared market data set to replay.
+     * @param data The prepared data set.
+     */
+    void set_market_data(MarketDataSet data);
+
+    /**
+     * @brief Prepares raw records and sets them as the data to replay.
+     *
+     * Convenience overload; prefer preparing once with DataLoader when
+     * running several backtests over the same data.
+     *
+     * @param data The market data records.
+     */
+    void set_market_data(std::vector<MarketData> data);
+
+    /**
+     * @brief Runs the backtest from the first to the last trading day.
+     * @param strategy The strategy to execute.
+     */
+    void run(Strategy& strategy);
+
+    /**
+     * @brief Runs the backtest over a date range.
+     *
+     * The day range is located with two binary searches over the sorted
+     * per-day index — no scan or mask over the full record array.
+     *
+     * @param strategy The strategy to execute.
+     * @param start_timestamp Epoch seconds; days ending before this are
+     * skipped.
+     * @param end_timestamp Epoch seconds; days starting after this are
+     * skipped.
+     */
+    void run(Strategy& strategy, std::int64_t start_timestamp,
+             std::int64_t end_timestamp);
+
+    /**
+     * @brief Gets the columnar log of orders executed during the run.
+     * @return The trade log.
+     */
+    const TradeLog& get_trade_log() const;
+
+    /**
+     * @brief Gets the cached YYYY-MM-DD stamp of each trading day.
+     * @return One date stamp per trading day.
+     */
+    const std::vector<std::string>& get_day_stamps() const;
+
+    /**
+     * @brief Gets the symbol name for each interned symbol id.
+     * @return The symbol table.
+     */
+    const std::vector<std::string>& get_symbol_table() const;
+
+    /**
+     * @brief Gets the end-of-day portfolio values recorded during the run.
+     * @return One portfolio value per trading day.
+     */
+    const std::vector<double>& get_portfolio_values() const;
+
+    /**
+     * @brief Gets the trading day index of each recorded portfolio value.
+     *
+     * Recorded alongside get_portfolio_values() as a parallel typed
+     * column, so a ranged run's values still map back to the right
+     * entries of get_day_stamps().
+     *
+     * @return One day index per recorded portfolio value.
+     */
+    const std::vector<std::uint32_t>& get_portfolio_value_days() const;
+
+    /**
+     * @brief Calculates summary metrics for the completed run.
+     *
+     * All statistics are computed in a single pass over the recorded
+     * portfolio values. The per-day drawdown series falls out of that
+     * pass and is cached for get_drawdowns(), so reporting consumers
+     * never recompute the cumulative maximum.
+     *
+     * @return The metrics for the run.
+     */
+    BacktestMetrics calculate_metrics();
+
+    /**
+     * @brief Gets the per-day drawdown series cached by
+     * calculate_metrics().
+     * @return One drawdown fraction (<= 0) per trading day.
+     */
+    const std::vector<double>& get_drawdowns() const;
+
+    /**
+     * @brief Gets the current cash balance.
+     * @return The cash balance.
+     */
+    double get_cash() const;
+
+    /**
+     * @brief Gets the currently open positions.
+     * @return The open positions.
+     */
+    const std::vector<Position>& get_positions() const;
+
+   private:
+    /**
+     * @brief Runs the backtest over a contiguous range of day indices.
+     * @param first_day The first day index to process.
+     * @param last_day One past the last day index to process.
+     * @param strategy The strategy to execute.
+     */
+    void run_days(std::size_t first_day, std::size_t last_day,
+                  Strategy& strategy);
+
+    /**
+     * @brief Processes one trading day's slice of the column arrays.
+     * @param batch A view over the day's records.
+     * @param day_index The index of the day within the run.
+     * @param strategy The strategy to execute.
+     */
+    void process_day(const MarketDataView& batch, std::uint32_t day_index,
+                     Strategy& strategy);
+
+    /**
+     * @brief Applies an executed order to cash, positions, and the log.
+     * @param order The order to apply.
+     * @param day_index The index of the day the order executed on.
+     */
+    void apply_order(const Order& order, std::uint32_t day_index);
+
+    /**
+     * @brief Interns a symbol name, growing the table if it is new.
+     * @param symbol The symbol name.
+     * @return The interned symbol id.
+     */
+    std::uint32_t intern_symbol(const std::string& symbol);
+
+    /**
+     * @brief Calculates the current portfolio value (cash plus positions).
+     *
+     * O(1): the positions total is maintained incrementally as orders
+     * are applied rather than summed over the position table per day.
+     *
+     * @return The portfolio value.
+     */
+    double calculate_portfolio_value() const;
+
+    double initial_capital; /**< The starting cash balance. */
+    double cash;            /**< The current cash balance. */
+    double positions_value = 0.0; /**< Running total value of positions. */
+    MarketDataSet market;   /**< The prepared data set being replayed. */
+    std::vector<Position> positions;     /**< The open positions. */
+    TradeLog trade_log;                  /**< Columnar log of trades. */
+    std::vector<double> portfolio_values; /**< End-of-day portfolio values. */
+    std::vector<std::uint32_t>
+        pv_day_indices; /**< Day index of each portfolio value. */
+    std::vector<double> drawdowns; /**< Per-day drawdown series, cached by
+                                      calculate_metrics(). */
+    std::unordered_map<std::string, std::uint32_t>
+        expiry_lookup; /**< Expiration date to interned id. */
+    std::vector<Order>
+        order_buffer; /**< Reusable per-day order buffer for run(). */
+};
+
+/**
+ * @brief Runs several independent backtests concurrently.
+ *
+ * Backtests over disjoint data shards (per symbol, or non-overlapping
+ * date windows) share no state, so they run embarrassingly parallel.
+ * Jobs are distributed over a pool of worker threads sized to the
+ * hardware concurrency.
+ *
+ * @param jobs Engine and strategy pairs; each engine must have its data
+ * set before the call.
+ */
+void run_backtests_parallel(
+    const std::vector<std::pair<BacktestEngine*, Strategy*>>& jobs);
+
+}  // namespace thales
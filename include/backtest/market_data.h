@@ -0,0 +1,70 @@
+/*
+ * MIT License
+ *
+ * Copyright (c) 2024 Cody Michael Jones
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining a copy
+ * of this software and associated documentation files (the "Software"), to deal
+ * in the Software without restriction, including without limitation the rights
+ * to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+ * copies of the Software, and to permit persons to whom the Software is
+ * furnished to do so, subject to the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be included in
+ * all copies or substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ * IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ * FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+ * AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ * LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+ * OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+ * SOFTWARE.
+ */
+
+#pragma once
+
+#include <cstddef>
+#include <cstdint>
+#include <string>
+
+namespace thales {
+
+/**
+ * @struct MarketData
+ * @brief A single market data record for one underlying quote.
+ *
+ * Records are kept in one contiguous, timestamp-sorted array so that a
+ * whole trading day can be handed to a strategy as a single batch instead
+ * of one call per record.
+ */
+struct MarketData {
+    std::string symbol;     /**< The ticker symbol of the underlying asset. */
+    std::int64_t timestamp; /**< The quote time in seconds since the epoch. */
+    double price;           /**< The price of the underlying asset. */
+    double volume;          /**< The traded volume of the underlying asset. */
+};
+
+/**
+ * @struct MarketDataView
+ * @brief A non-owning view over one day's slice of the column arrays.
+ *
+ * Strategies iterate the raw columns directly instead of materializing a
+ * record object per row, so the hot loop touches only flat arrays. All
+ * per-record columns hold trivially copyable values; symbols are interned
+ * once into a table and referenced by integer id, so handing a batch to a
+ * strategy (or across a language boundary) is a plain buffer handoff with
+ * no per-element conversion.
+ */
+struct MarketDataView {
+    const std::uint32_t* symbol_ids; /**< Interned symbol id column. */
+    const std::int64_t* timestamps;  /**< The epoch-seconds column. */
+    const float* prices;             /**< The underlying price column. */
+    const float* volumes;            /**< The traded volume column. */
+    std::size_t count;               /**< The number of records in the view. */
+    const std::string* symbol_table; /**< Symbol name for each interned id. */
+    std::size_t symbol_count;        /**< The number of interned symbols. */
+    const std::string* date; /**< Cached YYYY-MM-DD stamp for the day. */
+};
+
+}  // namespace thales
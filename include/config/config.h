@@ -25,10 +25,24 @@
 #pragma once
 
 #include <string>
+#include <unordered_map>
 
 namespace thales {
 class Config {
    public:
+    /**
+     * @brief Loads every key=value pair from a configuration file.
+     *
+     * The file is read in a single pass; callers look up as many keys as
+     * they need from the returned map instead of re-scanning the file
+     * once per key.
+     *
+     * @param path The path to the configuration file.
+     * @return The parsed key-value pairs.
+     */
+    static std::unordered_map<std::string, std::string> load(
+        const std::string& path);
+
     static std::string get_api_key();
 };
 }  // namespace thales
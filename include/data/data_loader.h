@@ -0,0 +1,220 @@
+/*
+ * MIT License
+ *
+ * Copyright (c) 2024 Cody Michael Jones
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining a copy
+ * of this software and associated documentation files (the "Software"), to deal
+ * in the Software without restriction, including without limitation the rights
+ * to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+ * copies of the Software, and to permit persons to whom the Software is
+ * furnished to do so, subject to the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be included in
+ * all copies or substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ * IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ * FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+ * AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ * LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+ * OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+ * SOFTWARE.
+ */
+
+#pragma once
+
+#include <cstddef>
+#include <cstdint>
+#include <string>
+#include <unordered_map>
+#include <utility>
+#include <vector>
+
+#include "backtest/market_data.h"
+
+namespace thales {
+
+/**
+ * @struct MarketDataSet
+ * @brief Fully prepared, column-oriented market data ready for replay.
+ *
+ * All load-time work — timestamp sorting, symbol interning, per-day
+ * grouping, and date-stamp formatting — is done once when the set is
+ * built, so consumers never re-derive any of it per run.
+ *
+ * Price and volume columns are stored as float: quote data carries
+ * nowhere near double precision, and the narrower columns halve memory
+ * traffic through the batch loop. Aggregations over them should still
+ * accumulate in double.
+ */
+struct MarketDataSet {
+    std::vector<std::uint32_t> symbol_ids; /**< Interned symbol id column. */
+    std::vector<std::string> symbol_table; /**< Symbol name per interned id. */
+    std::unordered_map<std::string, std::uint32_t>
+        symbol_lookup; /**< Symbol name to interned id. */
+    std::vector<std::int64_t> timestamps; /**< The epoch-seconds column. */
+    std::vector<float> prices;            /**< The underlying price column. */
+    std::vector<float> volumes;           /**< The traded volume column. */
+    std::vector<std::pair<std::size_t, std::size_t>>
+        day_slices; /**< Offset and count of each trading day's records. */
+    std::vector<std::string>
+        day_stamps; /**< Cached YYYY-MM-DD stamp per trading day. */
+    std::vector<float>
+        underlying_prices; /**< Day-major days-by-symbols matrix of the
+                              first observed price; NaN where a symbol
+                              has no record on a day. */
+
+    /**
+     * @brief Gets the first observed price of a symbol on a trading day.
+     * @param day_index The index of the trading day.
+     * @param symbol_id The interned symbol id.
+     * @return The price, or NaN if the symbol has no record that day.
+     */
+    float underlying_price(std::size_t day_index,
+                           std::uint32_t symbol_id) const {
+        return underlying_prices[day_index * symbol_table.size() + symbol_id];
+    }
+
+    /**
+     * @brief Finds the trading day containing an epoch-seconds timestamp.
+     *
+     * Binary search over the sorted per-day index. Combined with
+     * underlying_price(), a (symbol, date) probe costs O(log days) plus
+     * one table load instead of a scan over the record columns.
+     *
+     * @param timestamp Seconds since the epoch.
+     * @return The day index, or day_slices.size() if no record falls on
+     * that calendar day.
+     */
+    std::size_t day_index_of(std::int64_t timestamp) const;
+
+    /**
+     * @brief Gets a symbol's daily prices over a timestamp range.
+     *
+     * The day bounds are found with two binary searches over the sorted
+     * per-day index and the prices are gathered straight from the
+     * day-by-symbol table — O(log days + days in range), never a scan
+     * over the record columns.
+     *
+     * @param symbol_id The interned symbol id.
+     * @param start_timestamp Epoch seconds; earlier days are excluded.
+     * @param end_timestamp Epoch seconds; later days are excluded.
+     * @return One price per trading day in the range, NaN where the
+     * symbol has no record that day.
+     */
+    std::vector<float> underlying_price_range(
+        std::uint32_t symbol_id, std::int64_t start_timestamp,
+        std::int64_t end_timestamp) const;
+
+    /**
+     * @brief Builds a non-owning view over one trading day's records.
+     *
+     * The view borrows the set's columns in place — selecting a day is
+     * pointer arithmetic, never a copy of the day's rows.
+     *
+     * @param day_index The index of the trading day.
+     * @return A view over the day's slice of the column arrays.
+     */
+    MarketDataView day_view(std::size_t day_index) const {
+        const auto& slice = day_slices[day_index];
+        return MarketDataView{&symbol_ids[slice.first],
+                              &timestamps[slice.first],
+                              &prices[slice.first],
+                              &volumes[slice.first],
+                              slice.second,
+                              symbol_table.data(),
+                              symbol_table.size(),
+                              &day_stamps[day_index]};
+    }
+};
+
+/**
+ * @class DataLoader
+ * @brief Prepares raw market data records for backtesting.
+ */
+class DataLoader {
+   public:
+    /**
+     * @brief Builds a prepared column-oriented set from raw records.
+     *
+     * Sorts by timestamp, interns symbols, splits the records into flat
+     * columns, and groups them into per-day slices in one pass each.
+     *
+     * @param records The raw market data records.
+     * @return The prepared data set.
+     */
+    static MarketDataSet prepare(std::vector<MarketData> records);
+
+    /**
+     * @brief Loads market data from a CSV file and prepares it.
+     *
+     * Expects a header of symbol,date,price,volume with dates formatted
+     * YYYY-MM-DD. The file is streamed line by line straight into the
+     * record buffer — no intermediate per-row objects and no full-file
+     * buffer — then prepared with one prepare() call.
+     *
+     * @param path The path to the CSV file.
+     * @return The prepared data set.
+     */
+    static MarketDataSet load_csv(const std::string& path);
+
+    /**
+     * @brief Writes a prepared set to a binary columnar snapshot.
+     *
+     * The snapshot stores the symbol table and the raw columns; loading
+     * it back skips CSV parsing entirely. Derived indexes are rebuilt
+     * on load rather than stored.
+     *
+     * @param set The prepared data set to write.
+     * @param path The path of the snapshot file.
+     */
+    static void save_binary(const MarketDataSet& set, const std::string& path);
+
+    /**
+     * @brief Loads a prepared set from a binary columnar snapshot.
+     * @param path The path of the snapshot file.
+     * @return The prepared data set.
+     */
+    static MarketDataSet load_binary(const std::string& path);
+
+    /**
+     * @brief Filters a prepared set down to a date range and symbols.
+     *
+     * One combined predicate is evaluated per record and the surviving
+     * rows are gathered into the new set in a single pass — no
+     * intermediate copy of the full set and no per-predicate
+     * materialization.
+     *
+     * @param set The prepared data set to filter.
+     * @param start_timestamp Epoch seconds; earlier records are dropped.
+     * @param end_timestamp Epoch seconds; later records are dropped.
+     * @param symbol_ids Interned symbol ids to keep; empty keeps all.
+     * @return The filtered, prepared data set.
+     */
+    static MarketDataSet filter(const MarketDataSet& set,
+                                std::int64_t start_timestamp,
+                                std::int64_t end_timestamp,
+                                const std::vector<std::uint32_t>& symbol_ids =
+                                    {});
+
+    /**
+     * @brief Formats an epoch-seconds timestamp as a YYYY-MM-DD stamp.
+     * @param timestamp Seconds since the epoch.
+     * @return The formatted date stamp.
+     */
+    static std::string format_date(std::int64_t timestamp);
+
+   private:
+    /**
+     * @brief Sorts filled columns by timestamp and builds the indexes.
+     *
+     * Applies one argsort permutation across the columns, then builds the
+     * per-day slices, date stamps, and the day-by-symbol price table.
+     *
+     * @param set The data set with unsorted columns filled in.
+     */
+    static void finalize(MarketDataSet& set);
+};
+
+}  // namespace thales
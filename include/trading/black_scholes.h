@@ -25,6 +25,8 @@
 #pragma once
 
 #include <cmath>
+#include <cstddef>
+#include <vector>
 
 /**
  * @brief Option types
@@ -34,6 +36,13 @@ enum OptionType {
     PUT   /**< Put option */
 };
 
+// Forward declaration so the C-ABI batch entry can be befriended below;
+// documented with the extern "C" block at the end of this header.
+extern "C" void thales_bs_price_batch(const double* S, const double* K,
+                                      const double* T, double r,
+                                      const double* sigma, int is_call,
+                                      double* out, std::size_t n);
+
 /**
  * @brief Black-Scholes model for option pricing
  */
@@ -52,4 +61,221 @@ class BlackScholes {
      */
     static double calculate_option_price(double S, double K, double T, double r,
                                   double sigma, OptionType type);
+
+    /**
+     * @brief Calculate prices for a batch of options in one pass
+     *
+     * Prices a whole option chain with a single loop over contiguous
+     * arrays instead of one call per contract. Expired options
+     * (T == 0) are priced at intrinsic value rather than through the
+     * closed-form expression.
+     *
+     * @param S Current stock prices
+     * @param K Strike prices
+     * @param T Times to maturity (in years)
+     * @param r Risk-free interest rate
+     * @param sigma Volatilities
+     * @param type Option type (CALL or PUT), applied to the whole batch
+     * @return std::vector<double> Option prices, one per input element
+     */
+    static std::vector<double> calculate_option_prices(
+        const std::vector<double>& S, const std::vector<double>& K,
+        const std::vector<double>& T, double r,
+        const std::vector<double>& sigma, OptionType type);
+
+    /**
+     * @brief Calculate prices for a batch of options in single precision
+     *
+     * Overload of the batched pricer over float columns, for bulk
+     * backtests where halving the bytes per element matters more than
+     * the last few digits: ATM prices agree with the double path to
+     * well under a cent. Implied volatility stays double precision.
+     *
+     * @param S Current stock prices
+     * @param K Strike prices
+     * @param T Times to maturity (in years)
+     * @param r Risk-free interest rate
+     * @param sigma Volatilities
+     * @param type Option type (CALL or PUT), applied to the whole batch
+     * @return std::vector<float> Option prices, one per input element
+     */
+    static std::vector<float> calculate_option_prices(
+        const std::vector<float>& S, const std::vector<float>& K,
+        const std::vector<float>& T, float r, const std::vector<float>& sigma,
+        OptionType type);
+
+    /**
+     * @brief Calculate prices across one expiry's strike grid
+     *
+     * Within a single expiry every contract shares r and T, so the
+     * discount factor, sqrt(T) and log(S) are computed once for the
+     * whole grid instead of once per strike.
+     *
+     * @param S Current stock price
+     * @param K Strike prices
+     * @param T Time to maturity (in years), shared by the grid
+     * @param r Risk-free interest rate
+     * @param sigma Volatilities, one per strike
+     * @param type Option type (CALL or PUT), applied to the whole grid
+     * @return std::vector<double> Option prices, one per strike
+     */
+    static std::vector<double> calculate_option_prices_grid(
+        double S, const std::vector<double>& K, double T, double r,
+        const std::vector<double>& sigma, OptionType type);
+
+    /**
+     * @brief Calculate the vega of an option
+     *
+     * Vega is identical for calls and puts.
+     *
+     * @param S Current stock price
+     * @param K Strike price
+     * @param T Time to maturity (in years)
+     * @param r Risk-free interest rate
+     * @param sigma Volatility
+     * @return double Price sensitivity to a one-point volatility change
+     */
+    static double calculate_vega(double S, double K, double T, double r,
+                                 double sigma);
+
+    /**
+     * @brief Calculate the implied volatility from an observed price
+     *
+     * Runs the full Newton-Raphson iteration inside one function with
+     * no per-step dispatch.
+     *
+     * @param price Observed option price
+     * @param S Current stock price
+     * @param K Strike price
+     * @param T Time to maturity (in years)
+     * @param r Risk-free interest rate
+     * @param type Option type (CALL or PUT)
+     * @return double Implied volatility, or NaN if no solution is found
+     */
+    static double calculate_implied_volatility(double price, double S, double K,
+                                               double T, double r,
+                                               OptionType type);
+
+    /**
+     * @brief Calculate implied volatilities for a batch of options
+     *
+     * Each option's solve is independent, so the batch is split into
+     * contiguous blocks solved on worker threads sized to the hardware
+     * concurrency. Inputs are validated up front; solver failures come
+     * back as NaN rather than exceptions.
+     *
+     * @param prices Observed option prices
+     * @param S Current stock prices
+     * @param K Strike prices
+     * @param T Times to maturity (in years)
+     * @param r Risk-free interest rate
+     * @param type Option type (CALL or PUT), applied to the whole batch
+     * @return std::vector<double> Implied volatilities, NaN where no
+     * solution was found
+     */
+    static std::vector<double> calculate_implied_volatilities(
+        const std::vector<double>& prices, const std::vector<double>& S,
+        const std::vector<double>& K, const std::vector<double>& T, double r,
+        OptionType type);
+
+   private:
+    /**
+     * @brief Terms shared by the closed-form price expressions
+     */
+    struct Terms {
+        double d1;     /**< First Black-Scholes term */
+        double d2;     /**< Second Black-Scholes term */
+        double disc;   /**< Discount factor exp(-r * T) */
+        double sqrt_T; /**< Square root of the time to maturity */
+    };
+
+    /**
+     * @brief Compute d1, d2 and the discount factor in one pass
+     *
+     * sqrt(T) and sigma * sqrt(T) are evaluated once and shared between
+     * d1 and d2 instead of each expression recomputing them.
+     *
+     * @param S Current stock price
+     * @param K Strike price
+     * @param T Time to maturity (in years)
+     * @param r Risk-free interest rate
+     * @param sigma Volatility
+     * @return Terms The shared terms
+     */
+    static Terms compute_terms(double S, double K, double T, double r,
+                               double sigma);
+
+    /**
+     * @brief Price an option with no input validation
+     *
+     * Callers guarantee valid inputs; the public entry points validate
+     * once so iterative consumers such as the implied-vol solver do not
+     * pay the guard branches on every evaluation.
+     *
+     * @param S Current stock price
+     * @param K Strike price
+     * @param T Time to maturity (in years)
+     * @param r Risk-free interest rate
+     * @param sigma Volatility
+     * @param type Option type (CALL or PUT)
+     * @return double Option price
+     */
+    static double price_core(double S, double K, double T, double r,
+                             double sigma, OptionType type);
+
+    /**
+     * @brief Calculate vega with no input validation
+     * @param S Current stock price
+     * @param K Strike price
+     * @param T Time to maturity (in years)
+     * @param r Risk-free interest rate
+     * @param sigma Volatility
+     * @return double Price sensitivity to a one-point volatility change
+     */
+    static double vega_core(double S, double K, double T, double r,
+                            double sigma);
+
+    // The C-ABI batch entry prices through the unchecked core so it
+    // matches the C++ batch overloads exactly and, like them, bypasses
+    // the scalar path's memo cache.
+    friend void thales_bs_price_batch(const double* S, const double* K,
+                                      const double* T, double r,
+                                      const double* sigma, int is_call,
+                                      double* out, std::size_t n);
 };
+
+extern "C" {
+/**
+ * @brief C-linkage batched pricer for foreign-function callers
+ *
+ * Prices a whole chain through one call so bindings (ctypes, cffi, any
+ * FFI) pay a single crossing per chain instead of one per option. No
+ * exceptions cross the boundary: invalid elements produce NaN in out.
+ *
+ * @param S Current stock prices
+ * @param K Strike prices
+ * @param T Times to maturity (in years)
+ * @param r Risk-free interest rate
+ * @param sigma Volatilities
+ * @param is_call Nonzero for calls, zero for puts
+ * @param out Output buffer for n prices
+ * @param n Number of options
+ */
+void thales_bs_price_batch(const double* S, const double* K, const double* T,
+                           double r, const double* sigma, int is_call,
+                           double* out, std::size_t n);
+
+/**
+ * @brief C-linkage implied-volatility solver for foreign-function callers
+ *
+ * @param price Observed option price
+ * @param S Current stock price
+ * @param K Strike price
+ * @param T Time to maturity (in years)
+ * @param r Risk-free interest rate
+ * @param is_call Nonzero for a call, zero for a put
+ * @return double Implied volatility, or NaN on invalid input or no root
+ */
+double thales_bs_implied_vol(double price, double S, double K, double T,
+                             double r, int is_call);
+}
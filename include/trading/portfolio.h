@@ -25,6 +25,7 @@
 #pragma once
 
 #include <vector>
+#include "order.h"
 #include "position.h"
 
 namespace thales {
@@ -59,4 +60,28 @@ private:
     std::vector<Position> positions; /**< The positions held in the portfolio */
 };
 
+/**
+ * @brief Fetches the current portfolio information.
+ * @return The current portfolio.
+ */
+Portfolio fetch_portfolio();
+
+/**
+ * @brief Fetches the list of recently executed orders.
+ * @return A list of recently executed orders.
+ */
+std::vector<Order> fetch_orders();
+
+/**
+ * @brief Displays the portfolio information.
+ * @param portfolio The portfolio to display.
+ */
+void display_portfolio(const Portfolio& portfolio);
+
+/**
+ * @brief Displays the list of recently executed orders.
+ * @param orders The list of orders to display.
+ */
+void display_orders(const std::vector<Order>& orders);
+
 }  // namespace thales
@@ -0,0 +1,243 @@
+/*
+ * MIT License
+ *
+ * Copyright (c) 2024 Cody Michael Jones
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining a copy
+ * of this software and associated documentation files (the "Software"), to deal
+ * in the Software without restriction, including without limitation the rights
+ * to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+ * copies of the Software, and to permit persons to whom the Software is
+ * furnished to do so, subject to the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be included in
+ * all copies or substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ * IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ * FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+ * AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ * LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+ * OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+ * SOFTWARE.
+ */
+
+#pragma once
+
+#include <cstddef>
+#include <cstdint>
+#include <functional>
+#include <memory>
+#include <string>
+#include <unordered_map>
+#include <vector>
+
+#include "backtest/market_data.h"
+#include "trading/order.h"
+#include "trading/position.h"
+
+namespace thales {
+
+/**
+ * @struct PortfolioView
+ * @brief Non-owning view of the portfolio state during a backtest.
+ *
+ * Strategies receive this instead of a Portfolio object so the engine
+ * never copies the positions table — which grows with open positions —
+ * once per day just to describe its own state.
+ */
+struct PortfolioView {
+    double net_liquidity; /**< The current portfolio value. */
+    const std::vector<Position>* positions; /**< The open positions. */
+};
+
+/**
+ * @class Strategy
+ * @brief Base class for trading strategies.
+ *
+ * Strategies consume market data one trading day at a time. The whole
+ * day's records are passed as a single contiguous batch so per-call
+ * overhead is paid once per day, not once per record.
+ */
+class Strategy {
+   public:
+    virtual ~Strategy() = default;
+
+    /**
+     * @brief Gets the name of the strategy.
+     * @return The strategy name.
+     */
+    virtual std::string get_name() const = 0;
+
+    /**
+     * @brief Executes the strategy over one day's market data.
+     *
+     * Orders are appended to a caller-provided buffer so the engine can
+     * reuse one allocation across the whole run instead of receiving a
+     * fresh vector every day.
+     *
+     * @param batch A view over the day's raw column arrays.
+     * @param portfolio The current portfolio state.
+     * @param orders The buffer to append executed orders to.
+     */
+    virtual void execute_batch(const MarketDataView& batch,
+                               const PortfolioView& portfolio,
+                               std::vector<Order>& orders) = 0;
+};
+
+/**
+ * @struct Signal
+ * @brief One trading signal as plain trivially copyable fields.
+ *
+ * Signals reference the underlying by interned id instead of carrying
+ * strings, so a day's worth of them is a flat buffer with no per-object
+ * allocation — resolve the id through the batch's symbol table only
+ * when a name is actually needed.
+ */
+struct Signal {
+    std::uint32_t symbol_id; /**< Interned id of the underlying. */
+    double strike;           /**< Strike price of the marked call. */
+    double premium;          /**< Market premium at the quoted vol. */
+    double strength;         /**< Relative underpricing, clipped at 1.0. */
+};
+
+/**
+ * @class BlackScholesArbitrage
+ * @brief Volatility-arbitrage strategy over daily price batches.
+ *
+ * For every symbol in the day's batch the strategy marks a fixed-tenor
+ * at-the-money call twice: a theoretical value at its own volatility
+ * estimate and a market premium at the quoted implied volatility. Both
+ * markings price the whole day through one batched Black-Scholes call
+ * instead of one call per option. When the theoretical value exceeds
+ * the market premium by at least min_discrepancy, the option is
+ * considered underpriced and a buy order is emitted at the market
+ * premium.
+ */
+class BlackScholesArbitrage : public Strategy {
+   public:
+    /**
+     * @struct Config
+     * @brief Tunable parameters of the strategy.
+     */
+    struct Config {
+        double risk_free_rate = 0.02; /**< Annualized risk-free rate. */
+        double implied_volatility =
+            0.25; /**< Volatility the market quotes at. */
+        double volatility_estimate =
+            0.30; /**< Fallback volatility until enough history. */
+        double min_discrepancy =
+            0.10;            /**< Minimum relative mispricing to act on. */
+        int tenor_days = 30; /**< Days to expiry of the marked option. */
+        int quantity = 1;    /**< Contracts per order. */
+        int min_history =
+            5; /**< Daily returns needed before realized vol is used. */
+    };
+
+    BlackScholesArbitrage() = default;
+
+    /**
+     * @brief Constructs the strategy with explicit parameters.
+     * @param config The strategy parameters.
+     */
+    explicit BlackScholesArbitrage(Config config);
+
+    std::string get_name() const override;
+
+    void execute_batch(const MarketDataView& batch,
+                       const PortfolioView& portfolio,
+                       std::vector<Order>& orders) override;
+
+    /**
+     * @brief Gets the signals of the most recent batch.
+     * @return The signals that cleared min_discrepancy, in symbol order.
+     */
+    const std::vector<Signal>& get_signals() const;
+
+   private:
+    /**
+     * @struct VolState
+     * @brief Running return statistics for one symbol.
+     *
+     * Daily log returns are folded in incrementally (Welford's update),
+     * so the realized volatility never rescans the price history.
+     */
+    struct VolState {
+        double last_price = 0.0; /**< Previous day's opening price. */
+        int count = 0;           /**< Number of returns folded in. */
+        double mean = 0.0;       /**< Running mean of log returns. */
+        double m2 = 0.0;         /**< Running sum of squared deviations. */
+    };
+
+    /**
+     * @brief Folds a day's price into a symbol's return statistics.
+     * @param state The symbol's running statistics.
+     * @param price The day's opening price.
+     */
+    void update_volatility(VolState& state, double price) const;
+
+    /**
+     * @brief Gets a symbol's annualized realized volatility.
+     * @param state The symbol's running statistics.
+     * @return The annualized volatility, or the configured fallback
+     * while fewer than min_history returns have been observed.
+     */
+    double realized_volatility(const VolState& state) const;
+
+    Config config; /**< The strategy parameters. */
+    std::vector<VolState>
+        vol_states; /**< Running return statistics, indexed by symbol id. */
+
+    // Pricing columns reused across execute_batch calls. The universe
+    // size is stable day to day, so after the first batch these never
+    // reallocate. Symbol ids are dense, so the opening-price collection
+    // indexes flat per-id buffers instead of hashing into a map.
+    std::vector<double> first_prices;    /**< Opening price per symbol id. */
+    std::vector<std::uint8_t> seen;      /**< Symbol-id-seen flags. */
+    std::vector<std::uint32_t> symbols;  /**< Ids in first-seen order. */
+    std::vector<double> spots;           /**< Underlying price column. */
+    std::vector<double> strikes;         /**< Strike price column. */
+    std::vector<double> expiries;        /**< Time-to-expiry column. */
+    std::vector<double> sigma_estimates; /**< Realized volatility column. */
+    std::vector<double> sigma_quotes;    /**< Quoted volatility column. */
+    std::vector<double> strengths;       /**< Signal-strength column. */
+    std::vector<std::uint8_t> eligible;  /**< Fused eligibility mask. */
+    std::vector<Signal> signals;         /**< Most recent batch's signals. */
+};
+
+/**
+ * @class StrategyRegistry
+ * @brief Maps strategy names (e.g. from trading_strategy.cfg) to factories.
+ *
+ * Factories are registered once at startup; creating a strategy by name
+ * is then a single hash lookup, so config-driven creation inside a
+ * parameter sweep never repeats any resolution work.
+ */
+class StrategyRegistry {
+   public:
+    using Factory = std::function<std::unique_ptr<Strategy>()>;
+
+    /**
+     * @brief Registers a factory under a strategy name.
+     * @param name The strategy name.
+     * @param factory The factory producing instances of the strategy.
+     */
+    static void register_strategy(const std::string& name, Factory factory);
+
+    /**
+     * @brief Creates a strategy by registered name.
+     * @param name The strategy name.
+     * @return A new strategy instance.
+     * @throws std::invalid_argument If no factory is registered for name.
+     */
+    static std::unique_ptr<Strategy> create(const std::string& name);
+
+   private:
+    /**
+     * @brief Gets the factory table.
+     * @return The name-to-factory map.
+     */
+    static std::unordered_map<std::string, Factory>& factories();
+};
+
+}  // namespace thales
@@ -0,0 +1,279 @@
+/*
+ * MIT License
+ *
+ * Copyright (c) 2024 Cody Michael Jones
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining a copy
+ * of this software and associated documentation files (the "Software"), to deal
+ * in the Software without restriction, including without limitation the rights
+ * to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+ * copies of the Software, and to permit persons to whom the Software is
+ * furnished to do so, subject to the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be included in
+ * all copies or substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ * IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ * FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+ * AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ * LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+ * OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+ * SOFTWARE.
+ */
+
+#include "backtest/engine.h"
+
+#include <algorithm>
+#include <atomic>
+#include <cmath>
+#include <thread>
+
+namespace thales {
+
+namespace {
+// Each options contract covers 100 shares of the underlying.
+constexpr double CONTRACT_MULTIPLIER = 100.0;
+constexpr double TRADING_DAYS_PER_YEAR = 252.0;
+}  // namespace
+
+BacktestEngine::BacktestEngine(double initial_capital)
+    : initial_capital(initial_capital), cash(initial_capital) {}
+
+void BacktestEngine::set_market_data(MarketDataSet data) {
+    market = std::move(data);
+}
+
+void BacktestEngine::set_market_data(std::vector<MarketData> data) {
+    market = DataLoader::prepare(std::move(data));
+}
+
+std::uint32_t BacktestEngine::intern_symbol(const std::string& symbol) {
+    auto inserted = market.symbol_lookup.emplace(
+        symbol, static_cast<std::uint32_t>(market.symbol_table.size()));
+    if (inserted.second) {
+        market.symbol_table.push_back(symbol);
+    }
+    return inserted.first->second;
+}
+
+void BacktestEngine::run(Strategy& strategy) {
+    run_days(0, market.day_slices.size(), strategy);
+}
+
+void BacktestEngine::run(Strategy& strategy, std::int64_t start_timestamp,
+                         std::int64_t end_timestamp) {
+    // Two binary searches over the per-day index locate the range; the
+    // record columns themselves are never scanned.
+    const auto& slices = market.day_slices;
+    auto first = std::partition_point(
+        slices.begin(), slices.end(), [&](const auto& slice) {
+            return market.timestamps[slice.first + slice.second - 1] <
+                   start_timestamp;
+        });
+    auto last = std::partition_point(first, slices.end(),
+                                     [&](const auto& slice) {
+                                         return market.timestamps[slice.first] <=
+                                                end_timestamp;
+                                     });
+    run_days(static_cast<std::size_t>(first - slices.begin()),
+             static_cast<std::size_t>(last - slices.begin()), strategy);
+}
+
+void BacktestEngine::run_days(std::size_t first_day, std::size_t last_day,
+                              Strategy& strategy) {
+    cash = initial_capital;
+    positions.clear();
+    positions_value = 0.0;
+    trade_log = TradeLog();
+    expiry_lookup.clear();
+    portfolio_values.clear();
+    portfolio_values.reserve(last_day - first_day);
+    pv_day_indices.clear();
+    pv_day_indices.reserve(last_day - first_day);
+    drawdowns.clear();
+
+    for (std::size_t i = first_day; i < last_day; ++i) {
+        MarketDataView batch = market.day_view(i);
+        process_day(batch, static_cast<std::uint32_t>(i), strategy);
+        portfolio_values.push_back(calculate_portfolio_value());
+        pv_day_indices.push_back(static_cast<std::uint32_t>(i));
+    }
+}
+
+void BacktestEngine::process_day(const MarketDataView& batch,
+                                 std::uint32_t day_index, Strategy& strategy) {
+    // The view borrows the engine's own position table; nothing about the
+    // portfolio state is copied to describe it to the strategy.
+    PortfolioView snapshot{calculate_portfolio_value(), &positions};
+    // Reuse one buffer across days; clear() keeps its capacity, so steady
+    // state does no per-day heap allocation for order collection.
+    order_buffer.clear();
+    strategy.execute_batch(batch, snapshot, order_buffer);
+    for (const Order& order : order_buffer) {
+        apply_order(order, day_index);
+    }
+}
+
+void BacktestEngine::apply_order(const Order& order, std::uint32_t day_index) {
+    double cost = order.get_premium() * order.get_quantity() *
+                  CONTRACT_MULTIPLIER;
+
+    if (order.get_action() == "Buy") {
+        cash -= cost;
+        positions.emplace_back(order.get_symbol(), order.get_option_type(),
+                               order.get_strike_price(),
+                               order.get_expiration_date(),
+                               order.get_quantity(), order.get_premium());
+        positions_value += cost;
+    } else {
+        cash += cost;
+        for (auto it = positions.begin(); it != positions.end(); ++it) {
+            if (it->get_symbol() == order.get_symbol() &&
+                it->get_option_type() == order.get_option_type() &&
+                it->get_strike_price() == order.get_strike_price() &&
+                it->get_expiration_date() == order.get_expiration_date()) {
+                int remaining = it->get_quantity() - order.get_quantity();
+                int removed = remaining > 0 ? order.get_quantity()
+                                            : it->get_quantity();
+                positions_value -=
+                    it->get_premium() * removed * CONTRACT_MULTIPLIER;
+                if (remaining > 0) {
+                    *it = Position(it->get_symbol(), it->get_option_type(),
+                                   it->get_strike_price(),
+                                   it->get_expiration_date(), remaining,
+                                   it->get_premium());
+                } else {
+                    positions.erase(it);
+                }
+                break;
+            }
+        }
+    }
+
+    // Record the trade as one row of scalars across the columnar log.
+    bool is_buy = order.get_action() == "Buy";
+    auto inserted = expiry_lookup.emplace(
+        order.get_expiration_date(),
+        static_cast<std::uint32_t>(trade_log.expiry_table.size()));
+    if (inserted.second) {
+        trade_log.expiry_table.push_back(order.get_expiration_date());
+    }
+    trade_log.is_buy.push_back(is_buy ? 1 : 0);
+    trade_log.symbol_ids.push_back(intern_symbol(order.get_symbol()));
+    trade_log.is_call.push_back(order.get_option_type() == "Call" ? 1 : 0);
+    trade_log.strike_prices.push_back(order.get_strike_price());
+    trade_log.expiry_ids.push_back(inserted.first->second);
+    trade_log.quantities.push_back(order.get_quantity());
+    trade_log.premiums.push_back(order.get_premium());
+    trade_log.day_indices.push_back(day_index);
+}
+
+double BacktestEngine::calculate_portfolio_value() const {
+    // The positions total is maintained incrementally by apply_order, so
+    // valuing the portfolio never re-walks the position table.
+    return cash + positions_value;
+}
+
+BacktestMetrics BacktestEngine::calculate_metrics() {
+    BacktestMetrics metrics{0.0, 0.0, 0.0};
+    drawdowns.clear();
+    if (portfolio_values.empty()) {
+        return metrics;
+    }
+
+    metrics.total_return = portfolio_values.back() / initial_capital - 1.0;
+
+    // One pass accumulates the daily-return moments for the Sharpe ratio
+    // and tracks the running peak for the drawdown; the per-day drawdown
+    // series falls out of the same pass and is cached for reuse.
+    double sum = 0.0;
+    double sum_sq = 0.0;
+    double peak = portfolio_values.front();
+    std::size_t n_returns = portfolio_values.size() - 1;
+    drawdowns.reserve(portfolio_values.size());
+    for (std::size_t i = 0; i < portfolio_values.size(); ++i) {
+        if (i > 0) {
+            double daily_return =
+                portfolio_values[i] / portfolio_values[i - 1] - 1.0;
+            sum += daily_return;
+            sum_sq += daily_return * daily_return;
+        }
+        peak = std::max(peak, portfolio_values[i]);
+        double drawdown = portfolio_values[i] / peak - 1.0;
+        drawdowns.push_back(drawdown);
+        metrics.max_drawdown = std::min(metrics.max_drawdown, drawdown);
+    }
+
+    if (n_returns > 0) {
+        double mean = sum / n_returns;
+        double variance = sum_sq / n_returns - mean * mean;
+        if (variance > 0.0) {
+            metrics.sharpe_ratio =
+                mean / std::sqrt(variance) * std::sqrt(TRADING_DAYS_PER_YEAR);
+        }
+    }
+
+    return metrics;
+}
+
+const std::vector<double>& BacktestEngine::get_drawdowns() const {
+    return drawdowns;
+}
+
+const TradeLog& BacktestEngine::get_trade_log() const { return trade_log; }
+
+const std::vector<std::string>& BacktestEngine::get_day_stamps() const {
+    return market.day_stamps;
+}
+
+const std::vector<std::string>& BacktestEngine::get_symbol_table() const {
+    return market.symbol_table;
+}
+
+const std::vector<double>& BacktestEngine::get_portfolio_values() const {
+    return portfolio_values;
+}
+
+const std::vector<std::uint32_t>& BacktestEngine::get_portfolio_value_days()
+    const {
+    return pv_day_indices;
+}
+
+double BacktestEngine::get_cash() const { return cash; }
+
+const std::vector<Position>& BacktestEngine::get_positions() const {
+    return positions;
+}
+
+void run_backtests_parallel(
+    const std::vector<std::pair<BacktestEngine*, Strategy*>>& jobs) {
+    unsigned int hardware = std::thread::hardware_concurrency();
+    std::size_t n_workers = std::min<std::size_t>(
+        jobs.size(), hardware > 0 ? hardware : 1);
+    if (n_workers <= 1) {
+        for (const auto& job : jobs) {
+            job.first->run(*job.second);
+        }
+        return;
+    }
+
+    // Workers pull the next unclaimed job; no job shares an engine or a
+    // strategy, so there is no other shared state to guard.
+    std::atomic<std::size_t> next{0};
+    std::vector<std::thread> workers;
+    workers.reserve(n_workers);
+    for (std::size_t w = 0; w < n_workers; ++w) {
+        workers.emplace_back([&jobs, &next]() {
+            std::size_t i;
+            while ((i = next.fetch_add(1)) < jobs.size()) {
+                jobs[i].first->run(*jobs[i].second);
+            }
+        });
+    }
+    for (std::thread& worker : workers) {
+        worker.join();
+    }
+}
+
+}  // namespace thales
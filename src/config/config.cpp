@@ -28,15 +28,14 @@
 #include <stdexcept>
 
 namespace thales {
-std::string Config::get_api_key() {
-    // Assuming the executable is run from the build/ directory
-    std::string config_path = "../config/polygon_credentials.cfg";
-
-    std::ifstream file(config_path);
+std::unordered_map<std::string, std::string> Config::load(
+    const std::string& path) {
+    std::ifstream file(path);
     if (!file.is_open()) {
-        throw std::runtime_error("Unable to open configuration file: " + config_path);
+        throw std::runtime_error("Unable to open configuration file: " + path);
     }
 
+    std::unordered_map<std::string, std::string> settings;
     std::string line;
 
     while (std::getline(file, line)) {
@@ -44,12 +43,24 @@ std::string Config::get_api_key() {
         std::string key, value;
 
         if (std::getline(std::getline(iss, key, '='), value)) {
-            if (key == "API_KEY") {
-                return value;
-            }
+            settings[key] = value;
         }
     }
 
-    throw std::runtime_error("API_KEY not found in configuration file: " + config_path);
+    return settings;
+}
+
+std::string Config::get_api_key() {
+    // Assuming the executable is run from the build/ directory
+    std::string config_path = "../config/polygon_credentials.cfg";
+
+    auto settings = load(config_path);
+    auto it = settings.find("API_KEY");
+    if (it == settings.end()) {
+        throw std::runtime_error("API_KEY not found in configuration file: " +
+                                 config_path);
+    }
+
+    return it->second;
 }
 }  // namespace thales
@@ -21,3 +21,346 @@
  * OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
  * SOFTWARE.
  */
+
+#include "data/data_loader.h"
+
+#include <algorithm>
+#include <cmath>
+#include <cstdio>
+#include <cstdlib>
+#include <ctime>
+#include <fstream>
+#include <limits>
+#include <stdexcept>
+
+namespace thales {
+
+namespace {
+constexpr std::int64_t SECONDS_PER_DAY = 86400;
+constexpr char SNAPSHOT_MAGIC[8] = {'T', 'H', 'A', 'L', 'E', 'S', '0', '1'};
+
+// Parses a YYYY-MM-DD date as seconds since the epoch (midnight UTC).
+std::int64_t parse_date(const std::string& date) {
+    int year = 0, month = 0, day = 0;
+    if (std::sscanf(date.c_str(), "%4d-%2d-%2d", &year, &month, &day) != 3) {
+        throw std::runtime_error("Invalid date in CSV: " + date);
+    }
+    std::tm utc{};
+    utc.tm_year = year - 1900;
+    utc.tm_mon = month - 1;
+    utc.tm_mday = day;
+    return static_cast<std::int64_t>(timegm(&utc));
+}
+}  // namespace
+
+std::size_t MarketDataSet::day_index_of(std::int64_t timestamp) const {
+    std::int64_t day = timestamp / SECONDS_PER_DAY;
+    auto it = std::partition_point(
+        day_slices.begin(), day_slices.end(), [&](const auto& slice) {
+            return timestamps[slice.first] / SECONDS_PER_DAY < day;
+        });
+    if (it == day_slices.end() ||
+        timestamps[it->first] / SECONDS_PER_DAY != day) {
+        return day_slices.size();
+    }
+    return static_cast<std::size_t>(it - day_slices.begin());
+}
+
+std::vector<float> MarketDataSet::underlying_price_range(
+    std::uint32_t symbol_id, std::int64_t start_timestamp,
+    std::int64_t end_timestamp) const {
+    // Two binary searches bound the day range; the prices then come
+    // straight out of the day-by-symbol table.
+    auto first = std::partition_point(
+        day_slices.begin(), day_slices.end(), [&](const auto& slice) {
+            return timestamps[slice.first] / SECONDS_PER_DAY <
+                   start_timestamp / SECONDS_PER_DAY;
+        });
+    auto last = std::partition_point(
+        first, day_slices.end(), [&](const auto& slice) {
+            return timestamps[slice.first] / SECONDS_PER_DAY <=
+                   end_timestamp / SECONDS_PER_DAY;
+        });
+
+    std::size_t lo = static_cast<std::size_t>(first - day_slices.begin());
+    std::size_t hi = static_cast<std::size_t>(last - day_slices.begin());
+    std::vector<float> prices_out;
+    prices_out.reserve(hi - lo);
+    for (std::size_t day = lo; day < hi; ++day) {
+        prices_out.push_back(underlying_price(day, symbol_id));
+    }
+    return prices_out;
+}
+
+MarketDataSet DataLoader::filter(const MarketDataSet& set,
+                                 std::int64_t start_timestamp,
+                                 std::int64_t end_timestamp,
+                                 const std::vector<std::uint32_t>& symbol_ids) {
+    // The symbol predicate becomes one flag load per record.
+    std::vector<std::uint8_t> keep_symbol(set.symbol_table.size(),
+                                          symbol_ids.empty() ? 1 : 0);
+    for (std::uint32_t id : symbol_ids) {
+        keep_symbol[id] = 1;
+    }
+
+    MarketDataSet out;
+    out.symbol_table = set.symbol_table;
+    out.symbol_lookup = set.symbol_lookup;
+    for (std::size_t i = 0; i < set.timestamps.size(); ++i) {
+        if (set.timestamps[i] < start_timestamp ||
+            set.timestamps[i] > end_timestamp ||
+            !keep_symbol[set.symbol_ids[i]]) {
+            continue;
+        }
+        out.symbol_ids.push_back(set.symbol_ids[i]);
+        out.timestamps.push_back(set.timestamps[i]);
+        out.prices.push_back(set.prices[i]);
+        out.volumes.push_back(set.volumes[i]);
+    }
+
+    finalize(out);
+    return out;
+}
+
+void DataLoader::save_binary(const MarketDataSet& set,
+                             const std::string& path) {
+    std::ofstream file(path, std::ios::binary);
+    if (!file.is_open()) {
+        throw std::runtime_error("Unable to open snapshot file: " + path);
+    }
+
+    // A magic/version header, the symbol table, then each column written
+    // as one contiguous block — no per-record formatting on either side.
+    file.write(SNAPSHOT_MAGIC, sizeof(SNAPSHOT_MAGIC));
+    std::uint64_t n_records = set.timestamps.size();
+    std::uint64_t n_symbols = set.symbol_table.size();
+    file.write(reinterpret_cast<const char*>(&n_records), sizeof(n_records));
+    file.write(reinterpret_cast<const char*>(&n_symbols), sizeof(n_symbols));
+    for (const std::string& symbol : set.symbol_table) {
+        std::uint32_t length = static_cast<std::uint32_t>(symbol.size());
+        file.write(reinterpret_cast<const char*>(&length), sizeof(length));
+        file.write(symbol.data(), length);
+    }
+    file.write(reinterpret_cast<const char*>(set.symbol_ids.data()),
+               n_records * sizeof(std::uint32_t));
+    file.write(reinterpret_cast<const char*>(set.timestamps.data()),
+               n_records * sizeof(std::int64_t));
+    file.write(reinterpret_cast<const char*>(set.prices.data()),
+               n_records * sizeof(float));
+    file.write(reinterpret_cast<const char*>(set.volumes.data()),
+               n_records * sizeof(float));
+    if (!file) {
+        throw std::runtime_error("Failed writing snapshot file: " + path);
+    }
+}
+
+MarketDataSet DataLoader::load_binary(const std::string& path) {
+    std::ifstream file(path, std::ios::binary);
+    if (!file.is_open()) {
+        throw std::runtime_error("Unable to open snapshot file: " + path);
+    }
+
+    char magic[sizeof(SNAPSHOT_MAGIC)];
+    file.read(magic, sizeof(magic));
+    if (!file || !std::equal(magic, magic + sizeof(magic), SNAPSHOT_MAGIC)) {
+        throw std::runtime_error("Not a snapshot file: " + path);
+    }
+
+    std::uint64_t n_records = 0;
+    std::uint64_t n_symbols = 0;
+    file.read(reinterpret_cast<char*>(&n_records), sizeof(n_records));
+    file.read(reinterpret_cast<char*>(&n_symbols), sizeof(n_symbols));
+
+    MarketDataSet set;
+    set.symbol_table.reserve(n_symbols);
+    for (std::uint64_t i = 0; i < n_symbols; ++i) {
+        std::uint32_t length = 0;
+        file.read(reinterpret_cast<char*>(&length), sizeof(length));
+        std::string symbol(length, '\0');
+        file.read(&symbol[0], length);
+        set.symbol_lookup.emplace(symbol, static_cast<std::uint32_t>(i));
+        set.symbol_table.push_back(std::move(symbol));
+    }
+
+    set.symbol_ids.resize(n_records);
+    set.timestamps.resize(n_records);
+    set.prices.resize(n_records);
+    set.volumes.resize(n_records);
+    file.read(reinterpret_cast<char*>(set.symbol_ids.data()),
+              n_records * sizeof(std::uint32_t));
+    file.read(reinterpret_cast<char*>(set.timestamps.data()),
+              n_records * sizeof(std::int64_t));
+    file.read(reinterpret_cast<char*>(set.prices.data()),
+              n_records * sizeof(float));
+    file.read(reinterpret_cast<char*>(set.volumes.data()),
+              n_records * sizeof(float));
+    if (!file) {
+        throw std::runtime_error("Truncated snapshot file: " + path);
+    }
+
+    // The derived indexes are cheaper to rebuild than to store.
+    finalize(set);
+    return set;
+}
+
+std::string DataLoader::format_date(std::int64_t timestamp) {
+    std::time_t time = static_cast<std::time_t>(timestamp);
+    std::tm utc{};
+    gmtime_r(&time, &utc);
+    char buffer[16];
+    std::strftime(buffer, sizeof(buffer), "%Y-%m-%d", &utc);
+    return std::string(buffer);
+}
+
+MarketDataSet DataLoader::prepare(std::vector<MarketData> records) {
+    MarketDataSet set;
+    std::size_t n = records.size();
+    set.symbol_ids.reserve(n);
+    set.timestamps.reserve(n);
+    set.prices.reserve(n);
+    set.volumes.reserve(n);
+
+    // Split the records into flat columns, interning symbols so the
+    // per-record column is a plain integer buffer.
+    for (MarketData& record : records) {
+        auto inserted = set.symbol_lookup.emplace(
+            record.symbol,
+            static_cast<std::uint32_t>(set.symbol_table.size()));
+        if (inserted.second) {
+            set.symbol_table.push_back(std::move(record.symbol));
+        }
+        set.symbol_ids.push_back(inserted.first->second);
+        set.timestamps.push_back(record.timestamp);
+        set.prices.push_back(static_cast<float>(record.price));
+        set.volumes.push_back(static_cast<float>(record.volume));
+    }
+
+    finalize(set);
+    return set;
+}
+
+void DataLoader::finalize(MarketDataSet& set) {
+    // Sort the columns together through one argsort permutation instead
+    // of sorting row objects.
+    std::size_t n = set.timestamps.size();
+    std::vector<std::uint32_t> order(n);
+    for (std::size_t i = 0; i < n; ++i) {
+        order[i] = static_cast<std::uint32_t>(i);
+    }
+    std::stable_sort(order.begin(), order.end(),
+                     [&](std::uint32_t a, std::uint32_t b) {
+                         return set.timestamps[a] < set.timestamps[b];
+                     });
+
+    std::vector<std::uint32_t> sorted_ids(n);
+    std::vector<std::int64_t> sorted_ts(n);
+    std::vector<float> sorted_prices(n);
+    std::vector<float> sorted_volumes(n);
+    for (std::size_t i = 0; i < n; ++i) {
+        sorted_ids[i] = set.symbol_ids[order[i]];
+        sorted_ts[i] = set.timestamps[order[i]];
+        sorted_prices[i] = set.prices[order[i]];
+        sorted_volumes[i] = set.volumes[order[i]];
+    }
+    set.symbol_ids = std::move(sorted_ids);
+    set.timestamps = std::move(sorted_ts);
+    set.prices = std::move(sorted_prices);
+    set.volumes = std::move(sorted_volumes);
+
+    // Group into per-day slices and format each day's date stamp once.
+    set.day_slices.clear();
+    set.day_stamps.clear();
+    std::size_t day_begin = 0;
+    while (day_begin < set.timestamps.size()) {
+        std::int64_t day = set.timestamps[day_begin] / SECONDS_PER_DAY;
+        std::size_t day_end = day_begin + 1;
+        while (day_end < set.timestamps.size() &&
+               set.timestamps[day_end] / SECONDS_PER_DAY == day) {
+            ++day_end;
+        }
+        set.day_slices.emplace_back(day_begin, day_end - day_begin);
+        set.day_stamps.push_back(format_date(set.timestamps[day_begin]));
+        day_begin = day_end;
+    }
+
+    // One grouped pass fills the day-by-symbol price table; the first
+    // observation of a symbol on a day wins.
+    std::size_t n_symbols = set.symbol_table.size();
+    set.underlying_prices.assign(
+        set.day_slices.size() * n_symbols,
+        std::numeric_limits<float>::quiet_NaN());
+    for (std::size_t day = 0; day < set.day_slices.size(); ++day) {
+        const auto& slice = set.day_slices[day];
+        float* row = &set.underlying_prices[day * n_symbols];
+        for (std::size_t i = slice.first; i < slice.first + slice.second;
+             ++i) {
+            float& cell = row[set.symbol_ids[i]];
+            if (std::isnan(cell)) {
+                cell = set.prices[i];
+            }
+        }
+    }
+}
+
+MarketDataSet DataLoader::load_csv(const std::string& path) {
+    std::ifstream file(path);
+    if (!file.is_open()) {
+        throw std::runtime_error("Unable to open CSV file: " + path);
+    }
+
+    MarketDataSet set;
+
+    // Reserve the columns from the file size (a row of
+    // "SYMB,YYYY-MM-DD,price,volume" runs ~30 bytes) so steady-state
+    // appends never reallocate mid-parse.
+    file.seekg(0, std::ios::end);
+    std::size_t estimated_rows =
+        static_cast<std::size_t>(file.tellg()) / 30 + 1;
+    file.seekg(0);
+    set.symbol_ids.reserve(estimated_rows);
+    set.timestamps.reserve(estimated_rows);
+    set.prices.reserve(estimated_rows);
+    set.volumes.reserve(estimated_rows);
+
+    std::string line;
+    std::string symbol;
+    std::getline(file, line);  // Skip the header.
+
+    // Stream the file one line at a time, splitting fields in place and
+    // interning the symbol column as it is parsed — rows go straight into
+    // the integer/float columns with no per-row record objects.
+    while (std::getline(file, line)) {
+        if (line.empty()) {
+            continue;
+        }
+
+        std::size_t first = line.find(',');
+        std::size_t second = line.find(',', first + 1);
+        std::size_t third = line.find(',', second + 1);
+        if (first == std::string::npos || second == std::string::npos ||
+            third == std::string::npos) {
+            throw std::runtime_error("Malformed CSV line: " + line);
+        }
+
+        symbol.assign(line, 0, first);
+        auto inserted = set.symbol_lookup.emplace(
+            symbol, static_cast<std::uint32_t>(set.symbol_table.size()));
+        if (inserted.second) {
+            set.symbol_table.push_back(symbol);
+        }
+        set.symbol_ids.push_back(inserted.first->second);
+        set.timestamps.push_back(
+            parse_date(line.substr(first + 1, second - first - 1)));
+        set.prices.push_back(
+            static_cast<float>(std::strtod(line.c_str() + second + 1,
+                                           nullptr)));
+        set.volumes.push_back(
+            static_cast<float>(std::strtod(line.c_str() + third + 1,
+                                           nullptr)));
+    }
+
+    finalize(set);
+    return set;
+}
+
+}  // namespace thales
@@ -67,12 +67,9 @@ int main() {
         // Sleep for 1 second before updating
         std::this_thread::sleep_for(std::chrono::seconds(1));
 
-        // Clear the screen (platform-dependent)
-#if defined(_WIN32) || defined(_WIN64)
-        std::system("cls");
-#else
-        std::system("clear");
-#endif
+        // Clear the screen with one ANSI escape sequence instead of
+        // spawning a shell for `clear`/`cls` on every refresh.
+        std::cout << "\033[2J\033[H" << std::flush;
     }
 
     return EXIT_SUCCESS;
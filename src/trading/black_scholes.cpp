@@ -24,8 +24,94 @@
 
 #include "trading/black_scholes.h"
 
+#include <algorithm>
 #include <cmath>
+#include <cstdint>
 #include <stdexcept>
+#include <thread>
+#include <unordered_map>
+
+namespace {
+constexpr double INV_SQRT_2 = 0.7071067811865476;
+constexpr double INV_SQRT_2PI = 0.3989422804014327;
+
+// Bounds of the volatility search space for the implied-vol solver.
+constexpr double SIGMA_MIN = 1e-3;
+constexpr double SIGMA_MAX = 10.0;
+
+// Capacity of the scalar-path price cache; when full it is cleared
+// rather than evicted entry by entry.
+constexpr std::size_t PRICE_CACHE_MAX = 100000;
+
+// Scalar pricing inputs quantized past quote precision: cents for the
+// price dimensions, 1e-4 for volatility, 1e-5 years (~5 minutes) for
+// the tenor, 1e-6 for the rate. Adjacent strikes and dates collapse
+// into the same bucket.
+struct PriceKey {
+    std::int64_t S;
+    std::int64_t K;
+    std::int64_t T;
+    std::int64_t r;
+    std::int64_t sigma;
+    int type;
+
+    bool operator==(const PriceKey& other) const {
+        return S == other.S && K == other.K && T == other.T &&
+               r == other.r && sigma == other.sigma && type == other.type;
+    }
+};
+
+struct PriceKeyHash {
+    std::size_t operator()(const PriceKey& key) const {
+        std::size_t h = static_cast<std::size_t>(key.S);
+        for (std::int64_t part : {key.K, key.T, key.r, key.sigma,
+                                  static_cast<std::int64_t>(key.type)}) {
+            h ^= static_cast<std::size_t>(part) + 0x9e3779b97f4a7c15ULL +
+                 (h << 6) + (h >> 2);
+        }
+        return h;
+    }
+};
+
+std::int64_t quantize(double value, double scale) {
+    return std::llround(value * scale);
+}
+
+// Standard normal CDF; the 1/std::sqrt(2) factor is a compile-time constant
+// instead of a std::sqrt(2) call per evaluation.
+inline double norm_cdf(double x) { return 0.5 * (1 + std::erf(x * INV_SQRT_2)); }
+
+// Standard normal PDF.
+inline double norm_pdf(double x) { return INV_SQRT_2PI * std::exp(-0.5 * x * x); }
+
+// Single-precision normal CDF for the float batch path.
+inline float norm_cdf(float x) {
+    return 0.5f * (1 + std::erf(x * static_cast<float>(INV_SQRT_2)));
+}
+}  // namespace
+
+BlackScholes::Terms BlackScholes::compute_terms(double S, double K, double T,
+                                                double r, double sigma) {
+    double sqrt_T = std::sqrt(T);
+    double sig_sqrt_T = sigma * sqrt_T;
+    double d1 = (std::log(S / K) + (r + 0.5 * sigma * sigma) * T) / sig_sqrt_T;
+    return {d1, d1 - sig_sqrt_T, std::exp(-r * T), sqrt_T};
+}
+
+double BlackScholes::price_core(double S, double K, double T, double r,
+                                double sigma, OptionType type) {
+    Terms terms = compute_terms(S, K, T, r, sigma);
+    if (type == CALL) {
+        return S * norm_cdf(terms.d1) - K * terms.disc * norm_cdf(terms.d2);
+    }
+    return K * terms.disc * norm_cdf(-terms.d2) - S * norm_cdf(-terms.d1);
+}
+
+double BlackScholes::vega_core(double S, double K, double T, double r,
+                               double sigma) {
+    Terms terms = compute_terms(S, K, T, r, sigma);
+    return S * norm_pdf(terms.d1) * terms.sqrt_T;
+}
 
 double BlackScholes::calculate_option_price(double S, double K, double T,
                                             double r, double sigma,
@@ -33,19 +119,313 @@ double BlackScholes::calculate_option_price(double S, double K, double T,
     if (S <= 0 || K <= 0 || T < 0 || sigma < 0) {
         throw std::invalid_argument("Invalid input parameters");
     }
+    if (type != CALL && type != PUT) {
+        throw std::invalid_argument("Invalid option type");
+    }
+
+    // An expired option is worth its intrinsic value; the closed form
+    // divides by sigma * sqrt(T), so route T == 0 to the same intrinsic
+    // branch the batch paths take.
+    if (T == 0) {
+        double intrinsic = type == CALL ? S - K : K - S;
+        return intrinsic > 0 ? intrinsic : 0.0;
+    }
+
+    // Option chains price many rows with near-identical inputs, so the
+    // scalar path memoizes on the quantized key. The cache is
+    // thread_local — no locking under parallel backtests — and the
+    // batched paths bypass it entirely.
+    thread_local std::unordered_map<PriceKey, double, PriceKeyHash> cache;
+    PriceKey key{quantize(S, 100.0),  quantize(K, 100.0),
+                 quantize(T, 100000.0), quantize(r, 1000000.0),
+                 quantize(sigma, 10000.0), type};
+    auto it = cache.find(key);
+    if (it != cache.end()) {
+        return it->second;
+    }
+
+    double price = price_core(S, K, T, r, sigma, type);
+    if (cache.size() >= PRICE_CACHE_MAX) {
+        cache.clear();
+    }
+    cache.emplace(key, price);
+    return price;
+}
+
+std::vector<double> BlackScholes::calculate_option_prices(
+    const std::vector<double>& S, const std::vector<double>& K,
+    const std::vector<double>& T, double r, const std::vector<double>& sigma,
+    OptionType type) {
+    std::size_t n = S.size();
+    if (K.size() != n || T.size() != n || sigma.size() != n) {
+        throw std::invalid_argument("Mismatched input array lengths");
+    }
+    if (type != CALL && type != PUT) {
+        throw std::invalid_argument("Invalid option type");
+    }
+
+    std::vector<double> prices(n);
+    for (std::size_t i = 0; i < n; ++i) {
+        if (S[i] <= 0 || K[i] <= 0 || T[i] < 0 || sigma[i] < 0) {
+            throw std::invalid_argument("Invalid input parameters");
+        }
+
+        if (T[i] == 0) {
+            double intrinsic = type == CALL ? S[i] - K[i] : K[i] - S[i];
+            prices[i] = intrinsic > 0 ? intrinsic : 0.0;
+            continue;
+        }
+
+        prices[i] = price_core(S[i], K[i], T[i], r, sigma[i], type);
+    }
+    return prices;
+}
+
+std::vector<float> BlackScholes::calculate_option_prices(
+    const std::vector<float>& S, const std::vector<float>& K,
+    const std::vector<float>& T, float r, const std::vector<float>& sigma,
+    OptionType type) {
+    std::size_t n = S.size();
+    if (K.size() != n || T.size() != n || sigma.size() != n) {
+        throw std::invalid_argument("Mismatched input array lengths");
+    }
+    if (type != CALL && type != PUT) {
+        throw std::invalid_argument("Invalid option type");
+    }
+
+    std::vector<float> prices(n);
+    for (std::size_t i = 0; i < n; ++i) {
+        if (S[i] <= 0 || K[i] <= 0 || T[i] < 0 || sigma[i] < 0) {
+            throw std::invalid_argument("Invalid input parameters");
+        }
+
+        if (T[i] == 0) {
+            float intrinsic = type == CALL ? S[i] - K[i] : K[i] - S[i];
+            prices[i] = intrinsic > 0 ? intrinsic : 0.0f;
+            continue;
+        }
+
+        float sqrt_T = std::sqrt(T[i]);
+        float sig_sqrt_T = sigma[i] * sqrt_T;
+        float d1 = (std::log(S[i] / K[i]) +
+                    (r + 0.5f * sigma[i] * sigma[i]) * T[i]) /
+                   sig_sqrt_T;
+        float d2 = d1 - sig_sqrt_T;
+        float disc = std::exp(-r * T[i]);
+        if (type == CALL) {
+            prices[i] = S[i] * norm_cdf(d1) - K[i] * disc * norm_cdf(d2);
+        } else {
+            prices[i] = K[i] * disc * norm_cdf(-d2) - S[i] * norm_cdf(-d1);
+        }
+    }
+    return prices;
+}
+
+std::vector<double> BlackScholes::calculate_option_prices_grid(
+    double S, const std::vector<double>& K, double T, double r,
+    const std::vector<double>& sigma, OptionType type) {
+    std::size_t n = K.size();
+    if (sigma.size() != n) {
+        throw std::invalid_argument("Mismatched input array lengths");
+    }
+    if (type != CALL && type != PUT) {
+        throw std::invalid_argument("Invalid option type");
+    }
+    if (S <= 0 || T < 0) {
+        throw std::invalid_argument("Invalid input parameters");
+    }
+
+    std::vector<double> prices(n);
+    if (T == 0) {
+        for (std::size_t i = 0; i < n; ++i) {
+            double intrinsic = type == CALL ? S - K[i] : K[i] - S;
+            prices[i] = intrinsic > 0 ? intrinsic : 0.0;
+        }
+        return prices;
+    }
+
+    // Everything that depends only on (S, T, r) is hoisted out of the
+    // per-strike loop.
+    double sqrt_T = std::sqrt(T);
+    double disc = std::exp(-r * T);
+    double log_S = std::log(S);
+    for (std::size_t i = 0; i < n; ++i) {
+        if (K[i] <= 0 || sigma[i] < 0) {
+            throw std::invalid_argument("Invalid input parameters");
+        }
+        double sig_sqrt_T = sigma[i] * sqrt_T;
+        double d1 = (log_S - std::log(K[i]) +
+                     (r + 0.5 * sigma[i] * sigma[i]) * T) /
+                    sig_sqrt_T;
+        double d2 = d1 - sig_sqrt_T;
+        if (type == CALL) {
+            prices[i] = S * norm_cdf(d1) - K[i] * disc * norm_cdf(d2);
+        } else {
+            prices[i] = K[i] * disc * norm_cdf(-d2) - S * norm_cdf(-d1);
+        }
+    }
+    return prices;
+}
+
+double BlackScholes::calculate_vega(double S, double K, double T, double r,
+                                    double sigma) {
+    if (S <= 0 || K <= 0 || T < 0 || sigma < 0) {
+        throw std::invalid_argument("Invalid input parameters");
+    }
+
+    return vega_core(S, K, T, r, sigma);
+}
+
+double BlackScholes::calculate_implied_volatility(double price, double S,
+                                                  double K, double T, double r,
+                                                  OptionType type) {
+    if (price <= 0 || S <= 0 || K <= 0 || T <= 0) {
+        throw std::invalid_argument("Invalid input parameters");
+    }
+    if (type != CALL && type != PUT) {
+        throw std::invalid_argument("Invalid option type");
+    }
 
-    double d1 =
-        (log(S / K) + (r + sigma * sigma / 2.0) * T) / (sigma * sqrt(T));
-    double d2 = d1 - sigma * sqrt(T);
+    constexpr double EPSILON = 1e-4;
+    constexpr int MAX_NEWTON_ITERATIONS = 10;
+    constexpr int MAX_BISECTION_ITERATIONS = 60;
 
-    switch (type) {
-        case CALL:
-            return S * 0.5 * (1 + erf(d1 / sqrt(2))) -
-                   K * exp(-r * T) * 0.5 * (1 + erf(d2 / sqrt(2)));
-        case PUT:
-            return K * exp(-r * T) * 0.5 * (1 + erf(-d2 / sqrt(2))) -
-                   S * 0.5 * (1 + erf(-d1 / sqrt(2)));
-        default:
-            throw std::invalid_argument("Invalid option type");
+    // Everything that does not depend on sigma is hoisted out of the
+    // Newton loop.
+    double log_S_K = std::log(S / K);
+    double sqrt_T = std::sqrt(T);
+    double disc = std::exp(-r * T);
+
+    // Brenner-Subrahmanyam seed: near the money the price is roughly
+    // S * sigma * sqrt(T / (2 pi)), so inverting it lands the first
+    // Newton step close to the root instead of starting blind at 0.2.
+    double sigma =
+        std::clamp(std::sqrt(2.0 * M_PI / T) * price / (S * disc), 0.05, 2.0);
+    for (int i = 0; i < MAX_NEWTON_ITERATIONS; ++i) {
+        // One d1/d2 evaluation per step, shared by the model price and
+        // its vega instead of each core re-deriving the terms.
+        double sig_sqrt_T = sigma * sqrt_T;
+        double d1 = (log_S_K + (r + 0.5 * sigma * sigma) * T) / sig_sqrt_T;
+        double d2 = d1 - sig_sqrt_T;
+        double model = type == CALL
+                           ? S * norm_cdf(d1) - K * disc * norm_cdf(d2)
+                           : K * disc * norm_cdf(-d2) - S * norm_cdf(-d1);
+        double diff = model - price;
+        if (std::fabs(diff) < EPSILON) {
+            return sigma;
+        }
+        // Guard the denominator and clamp the step instead of branching
+        // on vanishing vega or out-of-range sigma: a tiny vega produces
+        // a huge step that the clamp pins to a bound, from which the
+        // next iteration recovers.
+        double vega = S * norm_pdf(d1) * sqrt_T;
+        sigma = std::clamp(sigma - diff / (vega + 1e-30), SIGMA_MIN, SIGMA_MAX);
+    }
+
+    // Far from the money vega flattens out and Newton stalls; the price
+    // is monotonic in sigma, so fall back to bisection on the bracket,
+    // which converges unconditionally when a root exists.
+    double lo = SIGMA_MIN;
+    double hi = SIGMA_MAX;
+    double diff_lo = price_core(S, K, T, r, lo, type) - price;
+    double diff_hi = price_core(S, K, T, r, hi, type) - price;
+    if (diff_lo * diff_hi > 0) {
+        return std::nan("");
+    }
+    for (int i = 0; i < MAX_BISECTION_ITERATIONS; ++i) {
+        sigma = 0.5 * (lo + hi);
+        double diff = price_core(S, K, T, r, sigma, type) - price;
+        if (std::fabs(diff) < EPSILON) {
+            return sigma;
+        }
+        if (diff * diff_lo < 0) {
+            hi = sigma;
+        } else {
+            lo = sigma;
+            diff_lo = diff;
+        }
+    }
+    return std::nan("");
+}
+
+void thales_bs_price_batch(const double* S, const double* K, const double* T,
+                           double r, const double* sigma, int is_call,
+                           double* out, std::size_t n) {
+    OptionType type = is_call ? CALL : PUT;
+    for (std::size_t i = 0; i < n; ++i) {
+        // NaN instead of an exception: nothing may throw across the C
+        // boundary.
+        if (S[i] <= 0 || K[i] <= 0 || T[i] < 0 || sigma[i] < 0) {
+            out[i] = std::nan("");
+            continue;
+        }
+        if (T[i] == 0) {
+            double intrinsic = type == CALL ? S[i] - K[i] : K[i] - S[i];
+            out[i] = intrinsic > 0 ? intrinsic : 0.0;
+            continue;
+        }
+        // The unchecked core, not the scalar entry point: the batch
+        // must match the C++ batch overloads bit-for-bit rather than
+        // return quantized values from the scalar memo cache.
+        out[i] = BlackScholes::price_core(S[i], K[i], T[i], r, sigma[i],
+                                          type);
+    }
+}
+
+double thales_bs_implied_vol(double price, double S, double K, double T,
+                             double r, int is_call) {
+    if (price <= 0 || S <= 0 || K <= 0 || T <= 0) {
+        return std::nan("");
+    }
+    return BlackScholes::calculate_implied_volatility(price, S, K, T, r,
+                                                      is_call ? CALL : PUT);
+}
+
+std::vector<double> BlackScholes::calculate_implied_volatilities(
+    const std::vector<double>& prices, const std::vector<double>& S,
+    const std::vector<double>& K, const std::vector<double>& T, double r,
+    OptionType type) {
+    std::size_t n = prices.size();
+    if (S.size() != n || K.size() != n || T.size() != n) {
+        throw std::invalid_argument("Mismatched input array lengths");
+    }
+    if (type != CALL && type != PUT) {
+        throw std::invalid_argument("Invalid option type");
+    }
+    for (std::size_t i = 0; i < n; ++i) {
+        if (prices[i] <= 0 || S[i] <= 0 || K[i] <= 0 || T[i] <= 0) {
+            throw std::invalid_argument("Invalid input parameters");
+        }
+    }
+
+    std::vector<double> sigmas(n);
+    auto solve_range = [&](std::size_t begin, std::size_t end) {
+        for (std::size_t i = begin; i < end; ++i) {
+            sigmas[i] =
+                calculate_implied_volatility(prices[i], S[i], K[i], T[i], r,
+                                             type);
+        }
+    };
+
+    unsigned int hardware = std::thread::hardware_concurrency();
+    std::size_t n_workers =
+        std::min<std::size_t>(n, hardware > 0 ? hardware : 1);
+    if (n_workers <= 1) {
+        solve_range(0, n);
+        return sigmas;
+    }
+
+    // Independent solves: split the batch into contiguous blocks, one
+    // per worker.
+    std::vector<std::thread> workers;
+    workers.reserve(n_workers);
+    for (std::size_t w = 0; w < n_workers; ++w) {
+        std::size_t begin = n * w / n_workers;
+        std::size_t end = n * (w + 1) / n_workers;
+        workers.emplace_back(solve_range, begin, end);
+    }
+    for (std::thread& worker : workers) {
+        worker.join();
     }
+    return sigmas;
 }
@@ -26,6 +26,7 @@
 
 #include <iostream>
 #include <iomanip>
+#include <sstream>
 #include <vector>
 
 #include "trading/order.h"
@@ -42,7 +43,9 @@ Portfolio::Portfolio(double net_liquidity, const std::vector<Position>& position
  * @brief Getters for Portfolio class members.
  */
 double Portfolio::get_net_liquidity() const { return net_liquidity; }
-std::vector<Position> Portfolio::get_positions() const { return positions; }
+const std::vector<Position>& Portfolio::get_positions() const {
+    return positions;
+}
 
 /**
  * @brief Fetches the current portfolio information.
@@ -85,16 +88,21 @@ std::vector<Order> fetch_orders() {
  * @param portfolio The portfolio to display.
  */
 void display_portfolio(const Portfolio& portfolio) {
-   // Display the header
-    std::cout << std::left << std::setw(10) << "Symbol"
-              << std::setw(10) << "Type"
-              << std::setw(10) << "Strike"
-              << std::setw(15) << "Expiration"
-              << std::setw(10) << "Quantity"
-              << std::setw(10) << "Premium"
-              << std::endl;
+    // The header and separator never change, so build them once instead
+    // of re-formatting them on every refresh of the display loop.
+    static const std::string header = []() {
+        std::ostringstream oss;
+        oss << std::left << std::setw(10) << "Symbol"
+            << std::setw(10) << "Type"
+            << std::setw(10) << "Strike"
+            << std::setw(15) << "Expiration"
+            << std::setw(10) << "Quantity"
+            << std::setw(10) << "Premium";
+        return oss.str();
+    }();
+    static const std::string separator(65, '-');
 
-    std::cout << std::string(65, '-') << std::endl;
+    std::cout << header << '\n' << separator << std::endl;
 
     // Display the portfolio positions
     for (const auto& position : portfolio.get_positions()) {
@@ -108,7 +116,7 @@ void display_portfolio(const Portfolio& portfolio) {
     }
 
     // Display the net liquidity
-    std::cout << std::string(65, '-') << std::endl;
+    std::cout << separator << std::endl;
     std::cout << std::left << std::setw(55) << "Net Liquidity: " << "$" << portfolio.get_net_liquidity() << std::endl;
 }
 
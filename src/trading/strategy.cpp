@@ -21,3 +21,163 @@
  * OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
  * SOFTWARE.
  */
+
+#include "trading/strategy.h"
+
+#include <algorithm>
+#include <cmath>
+#include <cstdint>
+#include <stdexcept>
+
+#include "data/data_loader.h"
+#include "trading/black_scholes.h"
+
+namespace thales {
+
+namespace {
+constexpr std::int64_t SECONDS_PER_DAY = 86400;
+constexpr double DAYS_PER_YEAR = 365.0;
+constexpr double TRADING_DAYS_PER_YEAR = 252.0;
+}  // namespace
+
+BlackScholesArbitrage::BlackScholesArbitrage(Config config) : config(config) {}
+
+std::string BlackScholesArbitrage::get_name() const {
+    return "BlackScholesArbitrage";
+}
+
+const std::vector<Signal>& BlackScholesArbitrage::get_signals() const {
+    return signals;
+}
+
+void BlackScholesArbitrage::update_volatility(VolState& state,
+                                              double price) const {
+    if (state.last_price > 0.0) {
+        // Welford's update over daily log returns: O(1) per day with no
+        // rescan of the price history.
+        double log_return = std::log(price / state.last_price);
+        state.count += 1;
+        double delta = log_return - state.mean;
+        state.mean += delta / state.count;
+        state.m2 += delta * (log_return - state.mean);
+    }
+    state.last_price = price;
+}
+
+double BlackScholesArbitrage::realized_volatility(
+    const VolState& state) const {
+    if (state.count < config.min_history) {
+        return config.volatility_estimate;
+    }
+    return std::sqrt(state.m2 / state.count * TRADING_DAYS_PER_YEAR);
+}
+
+void BlackScholesArbitrage::execute_batch(const MarketDataView& batch,
+                                          const PortfolioView& portfolio,
+                                          std::vector<Order>& orders) {
+    (void)portfolio;
+    if (batch.count == 0) {
+        return;
+    }
+
+    // One columnar pass collects each symbol's first (opening) price of
+    // the day into flat per-id buffers: each record costs one flag load,
+    // with no hashing and no per-batch allocation.
+    // Per-symbol return statistics live in a flat table indexed by
+    // interned id — one array load per update instead of a hash lookup.
+    // The table is only grown, never reset, so the statistics accumulate
+    // across the whole run.
+    if (vol_states.size() < batch.symbol_count) {
+        vol_states.resize(batch.symbol_count);
+    }
+
+    first_prices.assign(batch.symbol_count, 0.0);
+    seen.assign(batch.symbol_count, 0);
+    symbols.clear();
+    for (std::size_t i = 0; i < batch.count; ++i) {
+        std::uint32_t id = batch.symbol_ids[i];
+        if (!seen[id]) {
+            seen[id] = 1;
+            first_prices[id] = batch.prices[i];
+            symbols.push_back(id);
+        }
+    }
+
+    // Fill the reusable member columns; the tenor and quoted volatility
+    // are constants, so those columns are broadcast with assign() rather
+    // than written per symbol.
+    std::size_t n = symbols.size();
+    spots.resize(n);
+    strikes.resize(n);
+    expiries.assign(n, config.tenor_days / DAYS_PER_YEAR);
+    sigma_estimates.resize(n);
+    sigma_quotes.assign(n, config.implied_volatility);
+    for (std::size_t i = 0; i < n; ++i) {
+        double price = first_prices[symbols[i]];
+        VolState& state = vol_states[symbols[i]];
+        update_volatility(state, price);
+        spots[i] = price;
+        strikes[i] = price;  // Marked at the money.
+        sigma_estimates[i] = realized_volatility(state);
+    }
+
+    // Two batched pricing passes over the whole day: the theoretical
+    // value at the strategy's volatility estimate and the market
+    // premium at the quoted implied volatility.
+    std::vector<double> theo = BlackScholes::calculate_option_prices(
+        spots, strikes, expiries, config.risk_free_rate, sigma_estimates,
+        CALL);
+    std::vector<double> market = BlackScholes::calculate_option_prices(
+        spots, strikes, expiries, config.risk_free_rate, sigma_quotes, CALL);
+
+    // One branchless pass turns the priced batch into a signal-strength
+    // column — the relative underpricing clipped at 1.0 via std::min —
+    // and fuses the whole eligibility predicate (positive premium,
+    // finite strength, threshold) into a single mask byte with bitwise
+    // ANDs. The emission loop below branches only on the finished mask.
+    strengths.resize(n);
+    eligible.resize(n);
+    for (std::size_t i = 0; i < n; ++i) {
+        strengths[i] = std::min((theo[i] - market[i]) / market[i], 1.0);
+        eligible[i] = static_cast<std::uint8_t>(
+            (market[i] > 0.0) & static_cast<int>(std::isfinite(strengths[i])) &
+            (strengths[i] >= config.min_discrepancy));
+    }
+
+    // Every order in the batch shares one expiry, so format the date
+    // stamp once instead of once per emitted order.
+    std::string expiry = DataLoader::format_date(
+        batch.timestamps[0] + config.tenor_days * SECONDS_PER_DAY);
+    signals.clear();
+    for (std::size_t i = 0; i < n; ++i) {
+        if (eligible[i]) {
+            signals.push_back(
+                Signal{symbols[i], strikes[i], market[i], strengths[i]});
+            orders.push_back(Order("Buy", batch.symbol_table[symbols[i]],
+                                   "Call", strikes[i], expiry,
+                                   config.quantity, market[i], *batch.date));
+        }
+    }
+}
+
+std::unordered_map<std::string, StrategyRegistry::Factory>&
+StrategyRegistry::factories() {
+    static std::unordered_map<std::string, Factory> table;
+    return table;
+}
+
+void StrategyRegistry::register_strategy(const std::string& name,
+                                         Factory factory) {
+    factories()[name] = std::move(factory);
+}
+
+std::unique_ptr<Strategy> StrategyRegistry::create(const std::string& name) {
+    auto& table = factories();
+    auto it = table.find(name);
+    if (it == table.end()) {
+        throw std::invalid_argument("Unknown strategy: " + name);
+    }
+    return it->second();
+}
+
+}  // namespace thales
@@ -0,0 +1,237 @@
+/*
+ * MIT License
+ *
+ * Copyright (c) 2024 Cody Michael Jones
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining a copy
+ * of this software and associated documentation files (the "Software"), to deal
+ * in the Software without restriction, including without limitation the rights
+ * to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+ * copies of the Software, and to permit persons to whom the Software is
+ * furnished to do so, subject to the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be included in
+ * all copies or substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ * IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ * FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+ * AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ * LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+ * OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+ * SOFTWARE.
+ */
+
+#include <cstddef>
+#include <memory>
+#include <string>
+#include <vector>
+
+#include "backtest/engine.h"
+#include "gtest/gtest.h"
+
+namespace thales {
+
+namespace {
+
+/**
+ * @brief Test strategy that buys one contract on the first record of
+ * each day it sees.
+ */
+class BuyFirstRecordStrategy : public Strategy {
+   public:
+    std::string get_name() const override { return "BuyFirstRecord"; }
+
+    void execute_batch(const MarketDataView& batch,
+                       const PortfolioView& portfolio,
+                       std::vector<Order>& orders) override {
+        (void)portfolio;
+        if (batch.count > 0) {
+            orders.push_back(Order("Buy",
+                                   batch.symbol_table[batch.symbol_ids[0]],
+                                   "Call", 150.0, "2024-12-15", 1, 5.0,
+                                   *batch.date));
+        }
+        batches_seen.push_back(batch.count);
+    }
+
+    std::vector<std::size_t> batches_seen;
+};
+
+}  // namespace
+
+TEST(BacktestEngineTest, RunGroupsRecordsIntoDailyBatches) {
+    // Two records on day one, one record on day two.
+    std::vector<MarketData> data = {
+        {"AAPL", 86400 * 100 + 100, 150.0, 1000.0},
+        {"TSLA", 86400 * 100 + 200, 700.0, 2000.0},
+        {"AAPL", 86400 * 101 + 100, 151.0, 1500.0},
+    };
+
+    BacktestEngine engine(10000.0);
+    engine.set_market_data(data);
+
+    BuyFirstRecordStrategy strategy;
+    engine.run(strategy);
+
+    ASSERT_EQ(strategy.batches_seen.size(), 2);
+    EXPECT_EQ(strategy.batches_seen[0], 2);
+    EXPECT_EQ(strategy.batches_seen[1], 1);
+}
+
+TEST(BacktestEngineTest, RunAppliesOrdersToCashAndPositions) {
+    std::vector<MarketData> data = {
+        {"AAPL", 86400 * 100, 150.0, 1000.0},
+        {"AAPL", 86400 * 101, 151.0, 1500.0},
+    };
+
+    BacktestEngine engine(10000.0);
+    engine.set_market_data(data);
+
+    BuyFirstRecordStrategy strategy;
+    engine.run(strategy);
+
+    // Two days, one buy of 1 contract at $5.00 premium per day.
+    const TradeLog& log = engine.get_trade_log();
+    ASSERT_EQ(log.size(), 2);
+    EXPECT_EQ(log.is_buy[0], 1);
+    EXPECT_EQ(engine.get_symbol_table()[log.symbol_ids[0]], "AAPL");
+    EXPECT_EQ(log.expiry_table[log.expiry_ids[0]], "2024-12-15");
+    EXPECT_EQ(engine.get_day_stamps()[log.day_indices[0]], "1970-04-11");
+    EXPECT_EQ(engine.get_day_stamps()[log.day_indices[1]], "1970-04-12");
+    ASSERT_EQ(engine.get_positions().size(), 2);
+    EXPECT_DOUBLE_EQ(engine.get_cash(), 10000.0 - 2 * 5.0 * 100.0);
+
+    // Buying at the premium the position is marked at leaves value flat.
+    ASSERT_EQ(engine.get_portfolio_values().size(), 2);
+    EXPECT_DOUBLE_EQ(engine.get_portfolio_values().back(), 10000.0);
+}
+
+TEST(BacktestEngineTest, CalculateMetricsOnFlatRunIsZero) {
+    std::vector<MarketData> data = {
+        {"AAPL", 86400 * 100, 150.0, 1000.0},
+        {"AAPL", 86400 * 101, 151.0, 1500.0},
+    };
+
+    BacktestEngine engine(10000.0);
+    engine.set_market_data(data);
+
+    BuyFirstRecordStrategy strategy;
+    engine.run(strategy);
+
+    // Buying at the marked premium keeps the value flat at the initial
+    // capital, so every metric comes out zero.
+    BacktestMetrics metrics = engine.calculate_metrics();
+    EXPECT_DOUBLE_EQ(metrics.total_return, 0.0);
+    EXPECT_DOUBLE_EQ(metrics.sharpe_ratio, 0.0);
+    EXPECT_DOUBLE_EQ(metrics.max_drawdown, 0.0);
+
+    // The drawdown series is cached from the same pass.
+    ASSERT_EQ(engine.get_drawdowns().size(), 2);
+    EXPECT_DOUBLE_EQ(engine.get_drawdowns()[0], 0.0);
+}
+
+TEST(BacktestEngineTest, RunsFromPreparedDataSet) {
+    std::vector<MarketData> data = {
+        {"AAPL", 86400 * 100, 150.0, 1000.0},
+        {"AAPL", 86400 * 101, 151.0, 1500.0},
+    };
+
+    // Prepare once, replay in a fresh engine without re-preparing.
+    MarketDataSet set = DataLoader::prepare(data);
+    ASSERT_EQ(set.day_slices.size(), 2);
+    ASSERT_EQ(set.symbol_table.size(), 1);
+
+    BacktestEngine engine(10000.0);
+    engine.set_market_data(std::move(set));
+
+    BuyFirstRecordStrategy strategy;
+    engine.run(strategy);
+
+    ASSERT_EQ(strategy.batches_seen.size(), 2);
+    EXPECT_EQ(engine.get_trade_log().size(), 2);
+}
+
+TEST(BacktestEngineTest, SetMarketDataSortsByTimestamp) {
+    std::vector<MarketData> data = {
+        {"AAPL", 86400 * 101, 151.0, 1500.0},
+        {"AAPL", 86400 * 100, 150.0, 1000.0},
+    };
+
+    BacktestEngine engine(10000.0);
+    engine.set_market_data(data);
+
+    BuyFirstRecordStrategy strategy;
+    engine.run(strategy);
+
+    ASSERT_EQ(strategy.batches_seen.size(), 2);
+    EXPECT_EQ(strategy.batches_seen[0], 1);
+    EXPECT_EQ(strategy.batches_seen[1], 1);
+}
+
+TEST(BacktestEngineTest, RunWithDateRangeSelectsDays) {
+    std::vector<MarketData> data = {
+        {"AAPL", 86400 * 100, 150.0, 1000.0},
+        {"AAPL", 86400 * 101, 151.0, 1500.0},
+        {"AAPL", 86400 * 102, 152.0, 1200.0},
+    };
+
+    BacktestEngine engine(10000.0);
+    engine.set_market_data(data);
+
+    BuyFirstRecordStrategy strategy;
+    engine.run(strategy, 86400 * 101, 86400 * 101);
+
+    ASSERT_EQ(strategy.batches_seen.size(), 1);
+    ASSERT_EQ(engine.get_trade_log().size(), 1);
+    EXPECT_EQ(engine.get_day_stamps()[engine.get_trade_log().day_indices[0]],
+              "1970-04-12");
+
+    // The portfolio value keeps its day index even in a ranged run.
+    ASSERT_EQ(engine.get_portfolio_value_days().size(), 1);
+    EXPECT_EQ(engine.get_day_stamps()[engine.get_portfolio_value_days()[0]],
+              "1970-04-12");
+}
+
+TEST(BacktestEngineTest, StrategyRegistryCreatesByName) {
+    StrategyRegistry::register_strategy("BuyFirstRecord", []() {
+        return std::unique_ptr<Strategy>(new BuyFirstRecordStrategy());
+    });
+
+    std::unique_ptr<Strategy> strategy =
+        StrategyRegistry::create("BuyFirstRecord");
+    EXPECT_EQ(strategy->get_name(), "BuyFirstRecord");
+    EXPECT_THROW(StrategyRegistry::create("DoesNotExist"),
+                 std::invalid_argument);
+}
+
+TEST(BacktestEngineTest, ParallelRunsMatchSerialRuns) {
+    std::vector<MarketData> aapl = {
+        {"AAPL", 86400 * 100, 150.0, 1000.0},
+        {"AAPL", 86400 * 101, 151.0, 1500.0},
+    };
+    std::vector<MarketData> tsla = {
+        {"TSLA", 86400 * 100, 700.0, 2000.0},
+    };
+
+    BacktestEngine engine_a(10000.0);
+    BacktestEngine engine_b(10000.0);
+    engine_a.set_market_data(aapl);
+    engine_b.set_market_data(tsla);
+
+    BuyFirstRecordStrategy strategy_a;
+    BuyFirstRecordStrategy strategy_b;
+    run_backtests_parallel({{&engine_a, &strategy_a}, {&engine_b, &strategy_b}});
+
+    EXPECT_EQ(engine_a.get_trade_log().size(), 2);
+    EXPECT_EQ(engine_b.get_trade_log().size(), 1);
+    EXPECT_DOUBLE_EQ(engine_a.get_cash(), 10000.0 - 2 * 5.0 * 100.0);
+    EXPECT_DOUBLE_EQ(engine_b.get_cash(), 10000.0 - 5.0 * 100.0);
+}
+
+}  // namespace thales
+
+int main(int argc, char** argv) {
+    ::testing::InitGoogleTest(&argc, argv);
+    return RUN_ALL_TESTS();
+}
@@ -96,6 +96,202 @@ TEST_F(BlackScholesTest, LongTimeToExpiry) {
     ASSERT_NEAR(price, expected_price, 0.0001);
 }
 
+TEST_F(BlackScholesTest, BatchPricesMatchScalarPrices) {
+    std::vector<double> S = {100.0, 50.0, 100.0};
+    std::vector<double> K = {100.0, 100.0, 100.0};
+    std::vector<double> T = {1.0, 1.0, 10.0};
+    std::vector<double> sigma = {0.2, 0.2, 0.2};
+    double r = 0.05;
+
+    std::vector<double> prices =
+        BlackScholes::calculate_option_prices(S, K, T, r, sigma, OptionType::CALL);
+
+    ASSERT_EQ(prices.size(), 3);
+    for (std::size_t i = 0; i < prices.size(); ++i) {
+        double expected = BlackScholes::calculate_option_price(
+            S[i], K[i], T[i], r, sigma[i], OptionType::CALL);
+        ASSERT_NEAR(prices[i], expected, 1e-12);
+    }
+}
+
+TEST_F(BlackScholesTest, BatchPricesExpiredOptionAtIntrinsicValue) {
+    std::vector<double> prices = BlackScholes::calculate_option_prices(
+        {110.0, 90.0}, {100.0, 100.0}, {0.0, 0.0}, 0.05, {0.2, 0.2},
+        OptionType::CALL);
+
+    ASSERT_NEAR(prices[0], 10.0, 1e-12);
+    ASSERT_NEAR(prices[1], 0.0, 1e-12);
+}
+
+TEST_F(BlackScholesTest, SinglePrecisionBatchTracksDoublePrecision) {
+    std::vector<float> S = {100.0f, 95.0f, 105.0f};
+    std::vector<float> K = {100.0f, 100.0f, 100.0f};
+    std::vector<float> T = {1.0f, 0.5f, 2.0f};
+    std::vector<float> sigma = {0.2f, 0.3f, 0.15f};
+
+    std::vector<float> prices =
+        BlackScholes::calculate_option_prices(S, K, T, 0.05f, sigma,
+                                              OptionType::CALL);
+
+    ASSERT_EQ(prices.size(), 3);
+    for (std::size_t i = 0; i < prices.size(); ++i) {
+        double expected = BlackScholes::calculate_option_price(
+            S[i], K[i], T[i], 0.05, sigma[i], OptionType::CALL);
+        ASSERT_NEAR(prices[i], expected, 1e-4 * expected + 1e-4);
+    }
+}
+
+TEST_F(BlackScholesTest, GridPricesMatchScalarPrices) {
+    double S = 100.0;
+    double T = 1.0;
+    double r = 0.05;
+    std::vector<double> K = {80.0, 100.0, 120.0};
+    std::vector<double> sigma = {0.25, 0.2, 0.3};
+
+    std::vector<double> prices = BlackScholes::calculate_option_prices_grid(
+        S, K, T, r, sigma, OptionType::PUT);
+
+    ASSERT_EQ(prices.size(), 3);
+    for (std::size_t i = 0; i < prices.size(); ++i) {
+        double expected = BlackScholes::calculate_option_price(
+            S, K[i], T, r, sigma[i], OptionType::PUT);
+        ASSERT_NEAR(prices[i], expected, 1e-12);
+    }
+}
+
+TEST_F(BlackScholesTest, BatchThrowsOnMismatchedLengths) {
+    EXPECT_THROW(
+        BlackScholes::calculate_option_prices({100.0}, {100.0, 100.0}, {1.0},
+                                              0.05, {0.2}, OptionType::CALL),
+        std::invalid_argument
+    );
+}
+
+TEST_F(BlackScholesTest, ImpliedVolatilityRecoversSigma) {
+    double S = 100.0;
+    double K = 100.0;
+    double T = 1.0;
+    double r = 0.05;
+    double sigma = 0.25;
+
+    double call_price =
+        BlackScholes::calculate_option_price(S, K, T, r, sigma, OptionType::CALL);
+    double put_price =
+        BlackScholes::calculate_option_price(S, K, T, r, sigma, OptionType::PUT);
+
+    ASSERT_NEAR(BlackScholes::calculate_implied_volatility(call_price, S, K, T,
+                                                           r, OptionType::CALL),
+                sigma, 0.001);
+    ASSERT_NEAR(BlackScholes::calculate_implied_volatility(put_price, S, K, T,
+                                                           r, OptionType::PUT),
+                sigma, 0.001);
+}
+
+TEST_F(BlackScholesTest, BatchImpliedVolatilitiesMatchScalarSolver) {
+    std::vector<double> S = {100.0, 95.0, 105.0};
+    std::vector<double> K = {100.0, 100.0, 100.0};
+    std::vector<double> T = {1.0, 0.5, 2.0};
+    std::vector<double> sigma = {0.2, 0.3, 0.15};
+    double r = 0.05;
+
+    std::vector<double> prices =
+        BlackScholes::calculate_option_prices(S, K, T, r, sigma, OptionType::CALL);
+    std::vector<double> solved = BlackScholes::calculate_implied_volatilities(
+        prices, S, K, T, r, OptionType::CALL);
+
+    ASSERT_EQ(solved.size(), 3);
+    for (std::size_t i = 0; i < solved.size(); ++i) {
+        ASSERT_NEAR(solved[i], sigma[i], 0.001);
+    }
+}
+
+TEST_F(BlackScholesTest, ImpliedVolatilityHandlesDeepOutOfTheMoney) {
+    // Far OTM, where vega is nearly flat and Newton alone stalls.
+    double S = 100.0;
+    double K = 300.0;
+    double T = 0.1;
+    double r = 0.05;
+    double sigma = 0.9;
+
+    double price =
+        BlackScholes::calculate_option_price(S, K, T, r, sigma, OptionType::CALL);
+    double solved = BlackScholes::calculate_implied_volatility(price, S, K, T,
+                                                               r, OptionType::CALL);
+
+    ASSERT_NEAR(solved, sigma, 0.01);
+}
+
+TEST_F(BlackScholesTest, VegaIsPositiveAtTheMoney) {
+    double vega = BlackScholes::calculate_vega(100.0, 100.0, 1.0, 0.05, 0.2);
+    ASSERT_GT(vega, 0.0);
+    ASSERT_NEAR(vega, 37.524, 0.001);
+}
+
+TEST_F(BlackScholesTest, ExpiredScalarOptionPricesAtIntrinsicValue) {
+    ASSERT_DOUBLE_EQ(BlackScholes::calculate_option_price(
+                         105.0, 100.0, 0.0, 0.05, 0.2, OptionType::CALL),
+                     5.0);
+    // At the money the intrinsic value is zero, not NaN.
+    ASSERT_DOUBLE_EQ(BlackScholes::calculate_option_price(
+                         100.0, 100.0, 0.0, 0.05, 0.2, OptionType::CALL),
+                     0.0);
+    ASSERT_DOUBLE_EQ(BlackScholes::calculate_option_price(
+                         95.0, 100.0, 0.0, 0.05, 0.2, OptionType::PUT),
+                     5.0);
+}
+
+TEST_F(BlackScholesTest, ScalarPriceCacheCollapsesQuantizedInputs) {
+    double price = BlackScholes::calculate_option_price(100.0, 100.0, 1.0,
+                                                        0.05, 0.2,
+                                                        OptionType::CALL);
+    // Repeating the call returns the cached value exactly.
+    ASSERT_EQ(BlackScholes::calculate_option_price(100.0, 100.0, 1.0, 0.05,
+                                                   0.2, OptionType::CALL),
+              price);
+    // Inputs within the quantization step (cents for prices) share the
+    // same cache bucket.
+    ASSERT_EQ(BlackScholes::calculate_option_price(100.001, 100.0, 1.0,
+                                                   0.05, 0.2,
+                                                   OptionType::CALL),
+              price);
+    // Inputs a full step apart do not.
+    ASSERT_NE(BlackScholes::calculate_option_price(101.0, 100.0, 1.0, 0.05,
+                                                   0.2, OptionType::CALL),
+              price);
+}
+
+TEST_F(BlackScholesTest, CBindingPricesMatchAndNeverThrow) {
+    double S[] = {100.0, -1.0};
+    double K[] = {100.0, 100.0};
+    double T[] = {1.0, 1.0};
+    double sigma[] = {0.2, 0.2};
+    double out[2];
+
+    thales_bs_price_batch(S, K, T, 0.05, sigma, 1, out, 2);
+
+    double expected = BlackScholes::calculate_option_price(
+        100.0, 100.0, 1.0, 0.05, 0.2, OptionType::CALL);
+    ASSERT_NEAR(out[0], expected, 1e-12);
+    ASSERT_TRUE(std::isnan(out[1]));
+
+    ASSERT_NEAR(thales_bs_implied_vol(expected, 100.0, 100.0, 1.0, 0.05, 1),
+                0.2, 0.001);
+    ASSERT_TRUE(std::isnan(
+        thales_bs_implied_vol(-5.0, 100.0, 100.0, 1.0, 0.05, 1)));
+
+    // Inputs that share a scalar-cache bucket must not collapse through
+    // the FFI: the C batch matches the C++ batch bit-for-bit.
+    double S2[] = {100.001, 100.004};
+    double out2[2];
+    thales_bs_price_batch(S2, K, T, 0.05, sigma, 1, out2, 2);
+    std::vector<double> batch = BlackScholes::calculate_option_prices(
+        {100.001, 100.004}, {100.0, 100.0}, {1.0, 1.0}, 0.05, {0.2, 0.2},
+        OptionType::CALL);
+    ASSERT_EQ(out2[0], batch[0]);
+    ASSERT_EQ(out2[1], batch[1]);
+    ASSERT_NE(out2[0], out2[1]);
+}
+
 TEST_F(BlackScholesTest, InvalidOptionType) {
     EXPECT_THROW(
         BlackScholes::calculate_option_price(100.0, 100.0, 1.0, 0.05, 0.2, static_cast<OptionType>(-1)),
@@ -0,0 +1,223 @@
+/*
+ * MIT License
+ *
+ * Copyright (c) 2024 Cody Michael Jones
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining a copy
+ * of this software and associated documentation files (the "Software"), to deal
+ * in the Software without restriction, including without limitation the rights
+ * to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+ * copies of the Software, and to permit persons to whom the Software is
+ * furnished to do so, subject to the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be included in
+ * all copies or substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ * IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ * FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+ * AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ * LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+ * OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+ * SOFTWARE.
+ */
+
+#include <cmath>
+#include <cstdio>
+#include <fstream>
+#include <string>
+#include <vector>
+
+#include "data/data_loader.h"
+#include "gtest/gtest.h"
+
+namespace thales {
+
+namespace {
+
+/**
+ * @brief Writes a small CSV fixture and removes it when destroyed.
+ */
+class CsvFixture {
+   public:
+    explicit CsvFixture(const std::string& contents)
+        : path("test_data_loader_fixture.csv") {
+        std::ofstream file(path);
+        file << contents;
+    }
+
+    ~CsvFixture() { std::remove(path.c_str()); }
+
+    std::string path;
+};
+
+}  // namespace
+
+TEST(DataLoaderTest, PrepareSortsInternsAndGroups) {
+    std::vector<MarketData> records = {
+        {"TSLA", 86400 * 101, 700.0, 2000.0},
+        {"AAPL", 86400 * 100, 150.0, 1000.0},
+        {"TSLA", 86400 * 100, 698.0, 1800.0},
+    };
+
+    MarketDataSet set = DataLoader::prepare(records);
+
+    ASSERT_EQ(set.timestamps.size(), 3);
+    EXPECT_EQ(set.timestamps[0], 86400 * 100);
+    EXPECT_EQ(set.timestamps[2], 86400 * 101);
+    ASSERT_EQ(set.symbol_table.size(), 2);
+    ASSERT_EQ(set.day_slices.size(), 2);
+    EXPECT_EQ(set.day_slices[0].second, 2);
+    EXPECT_EQ(set.day_slices[1].second, 1);
+    EXPECT_EQ(set.day_stamps[0], "1970-04-11");
+}
+
+TEST(DataLoaderTest, PrepareBuildsUnderlyingPriceTable) {
+    std::vector<MarketData> records = {
+        {"AAPL", 86400 * 100, 150.0, 1000.0},
+        {"AAPL", 86400 * 100 + 60, 150.5, 500.0},
+        {"TSLA", 86400 * 100, 698.0, 1800.0},
+        {"TSLA", 86400 * 101, 700.0, 2000.0},
+    };
+
+    MarketDataSet set = DataLoader::prepare(records);
+
+    std::uint32_t aapl = set.symbol_lookup.at("AAPL");
+    std::uint32_t tsla = set.symbol_lookup.at("TSLA");
+    // First observation wins on day 0; AAPL has no record on day 1.
+    EXPECT_FLOAT_EQ(set.underlying_price(0, aapl), 150.0f);
+    EXPECT_FLOAT_EQ(set.underlying_price(0, tsla), 698.0f);
+    EXPECT_FLOAT_EQ(set.underlying_price(1, tsla), 700.0f);
+    EXPECT_TRUE(std::isnan(set.underlying_price(1, aapl)));
+}
+
+TEST(DataLoaderTest, DayIndexOfProbesBySearch) {
+    std::vector<MarketData> records = {
+        {"AAPL", 86400 * 100, 150.0, 1000.0},
+        {"AAPL", 86400 * 102, 152.0, 900.0},
+    };
+
+    MarketDataSet set = DataLoader::prepare(records);
+    std::uint32_t aapl = set.symbol_lookup.at("AAPL");
+
+    EXPECT_EQ(set.day_index_of(86400 * 100 + 3600), 0);
+    EXPECT_EQ(set.day_index_of(86400 * 102), 1);
+    // Day 101 has no records.
+    EXPECT_EQ(set.day_index_of(86400 * 101), set.day_slices.size());
+    EXPECT_FLOAT_EQ(
+        set.underlying_price(set.day_index_of(86400 * 102), aapl), 152.0f);
+}
+
+TEST(DataLoaderTest, UnderlyingPriceRangeGathersByDay) {
+    std::vector<MarketData> records = {
+        {"AAPL", 86400 * 100, 150.0, 1000.0},
+        {"TSLA", 86400 * 100, 698.0, 1800.0},
+        {"TSLA", 86400 * 101, 700.0, 2000.0},
+        {"AAPL", 86400 * 102, 152.0, 900.0},
+    };
+
+    MarketDataSet set = DataLoader::prepare(records);
+    std::uint32_t aapl = set.symbol_lookup.at("AAPL");
+
+    // Days 100-102 inclusive; AAPL has no record on day 101.
+    std::vector<float> prices =
+        set.underlying_price_range(aapl, 86400 * 100, 86400 * 102);
+    ASSERT_EQ(prices.size(), 3);
+    EXPECT_FLOAT_EQ(prices[0], 150.0f);
+    EXPECT_TRUE(std::isnan(prices[1]));
+    EXPECT_FLOAT_EQ(prices[2], 152.0f);
+
+    // A range past the data comes back empty.
+    EXPECT_TRUE(
+        set.underlying_price_range(aapl, 86400 * 200, 86400 * 210).empty());
+}
+
+TEST(DataLoaderTest, FilterKeepsDateRangeAndSymbols) {
+    std::vector<MarketData> records = {
+        {"AAPL", 86400 * 100, 150.0, 1000.0},
+        {"TSLA", 86400 * 100, 698.0, 1800.0},
+        {"AAPL", 86400 * 101, 151.0, 1200.0},
+        {"AAPL", 86400 * 102, 152.0, 900.0},
+    };
+
+    MarketDataSet set = DataLoader::prepare(records);
+    std::uint32_t aapl = set.symbol_lookup.at("AAPL");
+
+    MarketDataSet filtered =
+        DataLoader::filter(set, 86400 * 100, 86400 * 101, {aapl});
+
+    ASSERT_EQ(filtered.timestamps.size(), 2);
+    EXPECT_EQ(filtered.symbol_table[filtered.symbol_ids[0]], "AAPL");
+    EXPECT_EQ(filtered.symbol_table[filtered.symbol_ids[1]], "AAPL");
+    ASSERT_EQ(filtered.day_slices.size(), 2);
+    EXPECT_EQ(filtered.day_stamps[0], "1970-04-11");
+
+    // An empty symbol list keeps every symbol in the range.
+    MarketDataSet ranged = DataLoader::filter(set, 86400 * 100, 86400 * 100);
+    EXPECT_EQ(ranged.timestamps.size(), 2);
+}
+
+TEST(DataLoaderTest, LoadCsvParsesRecords) {
+    CsvFixture fixture(
+        "symbol,date,price,volume\n"
+        "AAPL,2024-01-02,185.64,1000\n"
+        "TSLA,2024-01-02,248.42,2000\n"
+        "AAPL,2024-01-03,184.25,1500\n");
+
+    MarketDataSet set = DataLoader::load_csv(fixture.path);
+
+    ASSERT_EQ(set.timestamps.size(), 3);
+    ASSERT_EQ(set.day_slices.size(), 2);
+    EXPECT_EQ(set.day_stamps[0], "2024-01-02");
+    EXPECT_EQ(set.day_stamps[1], "2024-01-03");
+    EXPECT_EQ(set.symbol_table[set.symbol_ids[0]], "AAPL");
+    EXPECT_FLOAT_EQ(set.prices[0], 185.64f);
+    EXPECT_FLOAT_EQ(set.volumes[1], 2000.0f);
+}
+
+TEST(DataLoaderTest, BinarySnapshotRoundTrips) {
+    std::vector<MarketData> records = {
+        {"AAPL", 86400 * 100, 150.0, 1000.0},
+        {"TSLA", 86400 * 100, 698.0, 1800.0},
+        {"AAPL", 86400 * 101, 151.0, 1200.0},
+    };
+    MarketDataSet set = DataLoader::prepare(records);
+
+    std::string path = "test_data_loader_snapshot.bin";
+    DataLoader::save_binary(set, path);
+    MarketDataSet loaded = DataLoader::load_binary(path);
+    std::remove(path.c_str());
+
+    ASSERT_EQ(loaded.timestamps.size(), set.timestamps.size());
+    EXPECT_EQ(loaded.timestamps, set.timestamps);
+    EXPECT_EQ(loaded.symbol_ids, set.symbol_ids);
+    EXPECT_EQ(loaded.prices, set.prices);
+    EXPECT_EQ(loaded.volumes, set.volumes);
+    EXPECT_EQ(loaded.symbol_table, set.symbol_table);
+    // The derived indexes are rebuilt on load.
+    EXPECT_EQ(loaded.day_stamps, set.day_stamps);
+    EXPECT_EQ(loaded.symbol_lookup.at("TSLA"), set.symbol_lookup.at("TSLA"));
+    std::uint32_t tsla = loaded.symbol_lookup.at("TSLA");
+    EXPECT_FLOAT_EQ(loaded.underlying_price(0, tsla), 698.0f);
+}
+
+TEST(DataLoaderTest, LoadBinaryThrowsOnMissingOrForeignFile) {
+    EXPECT_THROW(DataLoader::load_binary("does_not_exist.bin"),
+                 std::runtime_error);
+
+    // A CSV is not a snapshot; the magic check rejects it.
+    CsvFixture fixture("symbol,date,price,volume\n");
+    EXPECT_THROW(DataLoader::load_binary(fixture.path), std::runtime_error);
+}
+
+TEST(DataLoaderTest, LoadCsvThrowsOnMissingFile) {
+    EXPECT_THROW(DataLoader::load_csv("does_not_exist.csv"),
+                 std::runtime_error);
+}
+
+}  // namespace thales
+
+int main(int argc, char** argv) {
+    ::testing::InitGoogleTest(&argc, argv);
+    return RUN_ALL_TESTS();
+}
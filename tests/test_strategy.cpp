@@ -0,0 +1,111 @@
+/*
+ * MIT License
+ *
+ * Copyright (c) 2024 Cody Michael Jones
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining a copy
+ * of this software and associated documentation files (the "Software"), to deal
+ * in the Software without restriction, including without limitation the rights
+ * to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+ * copies of the Software, and to permit persons to whom the Software is
+ * furnished to do so, subject to the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be included in
+ * all copies or substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ * IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ * FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+ * AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ * LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+ * OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+ * SOFTWARE.
+ */
+
+#include <string>
+#include <vector>
+
+#include "backtest/engine.h"
+#include "gtest/gtest.h"
+
+namespace thales {
+
+TEST(BlackScholesArbitrageTest, EmitsBuyWhenTheoreticalExceedsMarket) {
+    // Default config: volatility estimate 0.30 against a quoted implied
+    // volatility of 0.25 — the marked call is underpriced by ~20%.
+    std::vector<MarketData> data = {
+        {"AAPL", 86400 * 100 + 100, 150.0, 1000.0},
+        {"AAPL", 86400 * 100 + 200, 151.0, 1100.0},
+        {"TSLA", 86400 * 100 + 150, 700.0, 2000.0},
+    };
+
+    BacktestEngine engine(100000.0);
+    engine.set_market_data(data);
+
+    BlackScholesArbitrage strategy;
+    engine.run(strategy);
+
+    // One order per symbol, struck at the symbol's opening price.
+    const TradeLog& log = engine.get_trade_log();
+    ASSERT_EQ(log.size(), 2);
+    EXPECT_EQ(log.is_buy[0], 1);
+    EXPECT_EQ(log.is_call[0], 1);
+    EXPECT_DOUBLE_EQ(log.strike_prices[0], 150.0);
+    EXPECT_DOUBLE_EQ(log.strike_prices[1], 700.0);
+    // Expiry is the batch date plus the 30-day tenor.
+    EXPECT_EQ(log.expiry_table[log.expiry_ids[0]], "1970-05-11");
+    EXPECT_GT(log.premiums[0], 0.0);
+
+    // The flat signal records mirror the emitted orders.
+    const std::vector<Signal>& signals = strategy.get_signals();
+    ASSERT_EQ(signals.size(), 2);
+    EXPECT_DOUBLE_EQ(signals[0].strike, 150.0);
+    EXPECT_DOUBLE_EQ(signals[1].strike, 700.0);
+    EXPECT_GE(signals[0].strength, 0.10);
+    EXPECT_LE(signals[0].strength, 1.0);
+    EXPECT_DOUBLE_EQ(signals[0].premium, log.premiums[0]);
+}
+
+TEST(BlackScholesArbitrageTest, NoOrdersWithoutDiscrepancy) {
+    std::vector<MarketData> data = {
+        {"AAPL", 86400 * 100, 150.0, 1000.0},
+    };
+
+    BacktestEngine engine(100000.0);
+    engine.set_market_data(data);
+
+    // Estimate equals the quoted vol, so nothing is mispriced.
+    BlackScholesArbitrage::Config config;
+    config.volatility_estimate = config.implied_volatility;
+    BlackScholesArbitrage strategy(config);
+    engine.run(strategy);
+
+    EXPECT_EQ(engine.get_trade_log().size(), 0);
+    EXPECT_EQ(strategy.get_name(), "BlackScholesArbitrage");
+}
+
+TEST(BlackScholesArbitrageTest, RealizedVolatilityTakesOverAfterWarmup) {
+    // Ten days of a dead-flat price: realized volatility is zero, so
+    // once enough returns accumulate the marked call is no longer
+    // underpriced and the buying stops.
+    std::vector<MarketData> data;
+    for (int day = 0; day < 10; ++day) {
+        data.push_back({"AAPL", 86400LL * (100 + day), 150.0, 1000.0});
+    }
+
+    BacktestEngine engine(100000.0);
+    engine.set_market_data(data);
+
+    BlackScholesArbitrage strategy;
+    engine.run(strategy);
+
+    // Buys only during the min_history warmup on the fallback estimate.
+    EXPECT_EQ(engine.get_trade_log().size(), 5);
+}
+
+}  // namespace thales
+
+int main(int argc, char** argv) {
+    ::testing::InitGoogleTest(&argc, argv);
+    return RUN_ALL_TESTS();
+}